@@ -3,6 +3,8 @@ AI player using minimax algorithm with alpha-beta pruning.
 Refactored to work with the new architecture.
 """
 import random
+import threading
+from concurrent.futures import Future
 from typing import Optional, Tuple
 
 from game.types import Color, Position, Move, PieceType
@@ -121,11 +123,39 @@ class AIPlayer:
         if self.game.game_state.is_game_over():
             return
         
+        self.apply_move(self.compute_move(self.game.game_state))
+    
+    def start_search(self) -> 'Future[Optional[Move]]':
+        """
+        Search for a move on a background thread.
+        The search runs on a copy of the game state, so the caller can keep
+        drawing the real one; apply the result with apply_move().
+        
+        Returns:
+            Future resolving to the chosen move (None if there is none)
+        """
+        future: 'Future[Optional[Move]]' = Future()
+        snapshot = self.game.game_state.copy()
+        
+        def run():
+            try:
+                future.set_result(self.compute_move(snapshot))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        # Daemon, so quitting mid-search does not wait for it to finish
+        threading.Thread(target=run, name="ai-search", daemon=True).start()
+        return future
+    
+    def compute_move(self, game_state: GameState) -> Optional[Move]:
+        """Pick a move for the given state without changing the game."""
         print(f"AI ({self.ai_color_str.upper()}) is thinking with depth {self.depth}...")
         
         # Get best move using minimax
-        best_move = self._get_best_move()
-        
+        return self._get_best_move(game_state)
+    
+    def apply_move(self, best_move: Optional[Move]):
+        """Play a move returned by compute_move() on the game."""
         if not best_move:
             print(f"AI ({self.ai_color_str.upper()}) has no legal moves.")
             return
@@ -138,10 +168,10 @@ class AIPlayer:
         else:
             print("AI move failed!")
     
-    def _get_best_move(self) -> Optional[Move]:
+    def _get_best_move(self, game_state: GameState) -> Optional[Move]:
         """Get the best move using minimax with alpha-beta pruning."""
         best_move, _ = self._minimax(
-            self.game.game_state,
+            game_state,
             self.depth,
             -float('inf'),
             float('inf'),
@@ -150,7 +180,7 @@ class AIPlayer:
         
         # If minimax doesn't find a move, pick a random legal one
         if not best_move:
-            legal_moves = self.game.game_state.get_all_legal_moves()
+            legal_moves = game_state.get_all_legal_moves()
             if legal_moves:
                 print("Minimax didn't find a best move, choosing randomly.")
                 best_move = random.choice(legal_moves)
@@ -13,4 +13,11 @@ LIGHT_COLOR_SQUARE = (238, 238, 210)
 DARK_COLOR_SQUARE = (118, 150, 86)
 HIGHLIGHT_COLOR = (255, 255, 0, 100)
 
+# Frame rate caps while something is moving or thinking, and while idle
+ACTIVE_FPS = 60
+IDLE_FPS = 20
+
+# Longest the main loop blocks waiting for input while nothing is moving
+IDLE_EVENT_TIMEOUT_MS = 1000 // IDLE_FPS
+
 ASSETS_PATH = os.path.join(os.path.dirname(__file__), 'assets')
\ No newline at end of file
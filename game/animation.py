@@ -32,6 +32,8 @@ class PieceAnimation:
         self.start_y = from_pos.row * square_size
         self.end_x = to_pos.col * square_size
         self.end_y = to_pos.row * square_size
+        self._dx = self.end_x - self.start_x
+        self._dy = self.end_y - self.start_y
         
         # Animation state
         self.start_time = pygame.time.get_ticks()
@@ -56,15 +58,18 @@ class PieceAnimation:
         # Apply ease-out effect for smoother animation
         progress = 1 - (1 - progress) ** 3
         
-        current_x = self.start_x + (self.end_x - self.start_x) * progress
-        current_y = self.start_y + (self.end_y - self.start_y) * progress
+        current_x = self.start_x + self._dx * progress
+        current_y = self.start_y + self._dy * progress
         
         return (int(current_x), int(current_y))
     
-    def draw(self, screen: pygame.Surface):
-        """Draw the animated piece at its current position."""
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        """
+        Draw the animated piece at its current position and return the area covered.
+        The piece image is blitted as given; nothing is allocated or scaled per frame.
+        """
         x, y = self.update()
-        screen.blit(self.piece_image, (x, y))
+        return screen.blit(self.piece_image, (x, y))
 
 
 class AnimationManager:
@@ -119,10 +124,11 @@ class AnimationManager:
         """Check if animation or delay is in progress."""
         return self.is_animating() or self.is_delay_active()
     
-    def draw_animation(self, screen: pygame.Surface):
-        """Draw the current animation if active."""
+    def draw_animation(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """Draw the current animation if active and return the area covered."""
         if self.current_animation and not self.current_animation.is_complete:
-            self.current_animation.draw(screen)
+            return self.current_animation.draw(screen)
+        return None
     
     def clear(self):
         """Clear current animation."""
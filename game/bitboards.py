@@ -0,0 +1,119 @@
+"""
+Bitboard helpers and precomputed attack tables.
+
+Squares are indexed as row * 8 + col, matching Position (row 0 is rank 8,
+col 0 is the a-file). Bit n of a bitboard is set when square n is occupied
+or attacked.
+"""
+from typing import Dict, List, Tuple
+
+from game.types import Color
+
+
+def square_index(row: int, col: int) -> int:
+    """Convert a (row, col) pair to a 0-63 square index."""
+    return row * 8 + col
+
+
+def _leaper_attacks(offsets: List[Tuple[int, int]]) -> Tuple[int, ...]:
+    """Build a 64-entry attack table for a piece that jumps by fixed offsets."""
+    table = []
+    for row in range(8):
+        for col in range(8):
+            attacks = 0
+            for dr, dc in offsets:
+                new_row, new_col = row + dr, col + dc
+                if 0 <= new_row < 8 and 0 <= new_col < 8:
+                    attacks |= 1 << square_index(new_row, new_col)
+            table.append(attacks)
+    return tuple(table)
+
+
+KNIGHT_OFFSETS = [
+    (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+    (1, -2), (1, 2), (2, -1), (2, 1)
+]
+
+KING_OFFSETS = [
+    (0, 1), (0, -1), (1, 0), (-1, 0),
+    (1, 1), (1, -1), (-1, 1), (-1, -1)
+]
+
+KNIGHT_ATTACKS = _leaper_attacks(KNIGHT_OFFSETS)
+KING_ATTACKS = _leaper_attacks(KING_OFFSETS)
+
+# Squares attacked diagonally by a pawn of each color (white moves up the board)
+PAWN_ATTACKS: Dict[Color, Tuple[int, ...]] = {
+    Color.WHITE: _leaper_attacks([(-1, -1), (-1, 1)]),
+    Color.BLACK: _leaper_attacks([(1, -1), (1, 1)]),
+}
+
+# Square one step forward for a pawn of each color (0 off the board)
+PAWN_PUSHES: Dict[Color, Tuple[int, ...]] = {
+    Color.WHITE: _leaper_attacks([(-1, 0)]),
+    Color.BLACK: _leaper_attacks([(1, 0)]),
+}
+
+# Rank each color's pawns start on (and may double-push from)
+PAWN_START_RANKS: Dict[Color, int] = {
+    Color.WHITE: 0xFF << 48,
+    Color.BLACK: 0xFF << 8,
+}
+
+# First and last rows, where pawns promote
+PROMOTION_RANKS = 0xFF | (0xFF << 56)
+
+
+def _ray_table(dr: int, dc: int) -> Tuple[int, ...]:
+    """Squares strictly beyond each square in one direction, up to the edge."""
+    table = []
+    for row in range(8):
+        for col in range(8):
+            ray = 0
+            new_row, new_col = row + dr, col + dc
+            while 0 <= new_row < 8 and 0 <= new_col < 8:
+                ray |= 1 << square_index(new_row, new_col)
+                new_row += dr
+                new_col += dc
+            table.append(ray)
+    return tuple(table)
+
+
+# Rays split by whether they run towards higher or lower square indices:
+# the nearest blocker is the lowest set bit on a positive ray and the
+# highest set bit on a negative one.
+_ROOK_RAYS_POS = (_ray_table(0, 1), _ray_table(1, 0))
+_ROOK_RAYS_NEG = (_ray_table(0, -1), _ray_table(-1, 0))
+_BISHOP_RAYS_POS = (_ray_table(1, 1), _ray_table(1, -1))
+_BISHOP_RAYS_NEG = (_ray_table(-1, 1), _ray_table(-1, -1))
+
+
+def _sliding_attacks(sq: int, occ: int, positive_rays, negative_rays) -> int:
+    """
+    Attacks along the given rays, stopping at (and including) the first
+    occupied square. Each ray costs one mask and at most one bit scan.
+    """
+    attacks = 0
+    for rays in positive_rays:
+        ray = rays[sq]
+        blockers = ray & occ
+        if blockers:
+            ray ^= rays[(blockers & -blockers).bit_length() - 1]
+        attacks |= ray
+    for rays in negative_rays:
+        ray = rays[sq]
+        blockers = ray & occ
+        if blockers:
+            ray ^= rays[blockers.bit_length() - 1]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(sq: int, occ: int) -> int:
+    """Squares a rook on sq attacks given the occupancy bitboard occ."""
+    return _sliding_attacks(sq, occ, _ROOK_RAYS_POS, _ROOK_RAYS_NEG)
+
+
+def bishop_attacks(sq: int, occ: int) -> int:
+    """Squares a bishop on sq attacks given the occupancy bitboard occ."""
+    return _sliding_attacks(sq, occ, _BISHOP_RAYS_POS, _BISHOP_RAYS_NEG)
@@ -2,10 +2,11 @@
 Board class for managing piece positions.
 """
 from typing import Optional, List, Dict
-import copy
 
 from game.types import Color, PieceType, Position, CastlingRights
 from game.pieces import Piece, create_piece, piece_from_string
+from game.bitboards import (KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS,
+                            rook_attacks, bishop_attacks)
 
 
 class Board:
@@ -16,9 +17,17 @@ class Board:
     
     def __init__(self):
         """Initialize an empty board."""
-        self._board: List[List[Optional[Piece]]] = [[None for _ in range(8)] for _ in range(8)]
+        # Flat square array indexed by row * 8 + col
+        self._squares: List[Optional[Piece]] = [None] * 64
         self.castling_rights = CastlingRights()
         self.en_passant_target: Optional[Position] = None
+        # King squares tracked incrementally so find_king is a lookup
+        self.king_pos: Dict[Color, Optional[Position]] = {Color.WHITE: None, Color.BLACK: None}
+        # Bitboards (bit row * 8 + col) kept in sync with the square array
+        self.bitboards: Dict[PieceType, int] = {piece_type: 0 for piece_type in PieceType}
+        self.occupancy: Dict[Color, int] = {Color.WHITE: 0, Color.BLACK: 0}
+        # Bumped on every square change so callers can tell when cached moves are stale
+        self.version = 0
         
     def setup_initial_position(self):
         """Set up the standard chess starting position."""
@@ -27,27 +36,51 @@ class Board:
                       PieceType.KING, PieceType.BISHOP, PieceType.KNIGHT, PieceType.ROOK]
         
         for col, piece_type in enumerate(piece_order):
-            self._board[0][col] = create_piece(Color.BLACK, piece_type)
-            self._board[7][col] = create_piece(Color.WHITE, piece_type)
+            self.set_piece(Position(0, col), create_piece(Color.BLACK, piece_type))
+            self.set_piece(Position(7, col), create_piece(Color.WHITE, piece_type))
         
         for col in range(8):
-            self._board[1][col] = create_piece(Color.BLACK, PieceType.PAWN)
-            self._board[6][col] = create_piece(Color.WHITE, PieceType.PAWN)
+            self.set_piece(Position(1, col), create_piece(Color.BLACK, PieceType.PAWN))
+            self.set_piece(Position(6, col), create_piece(Color.WHITE, PieceType.PAWN))
     
     def get_piece(self, position: Position) -> Optional[Piece]:
         """Get the piece at the given position."""
-        return self._board[position.row][position.col]
+        return self._squares[position.row * 8 + position.col]
     
     def set_piece(self, position: Position, piece: Optional[Piece]):
         """Set a piece at the given position."""
-        self._board[position.row][position.col] = piece
+        self._clear_square(position)
+        if piece is None:
+            return
+        self.version += 1
+        sq = position.row * 8 + position.col
+        self._squares[sq] = piece
+        bit = 1 << sq
+        self.bitboards[piece.piece_type] |= bit
+        self.occupancy[piece.color] |= bit
+        if piece.piece_type is PieceType.KING:
+            self.king_pos[piece.color] = position
     
     def remove_piece(self, position: Position) -> Optional[Piece]:
         """Remove and return the piece at the given position."""
-        piece = self._board[position.row][position.col]
-        self._board[position.row][position.col] = None
+        piece = self._squares[position.row * 8 + position.col]
+        self._clear_square(position)
         return piece
     
+    def _clear_square(self, position: Position):
+        """Empty a square, keeping bitboards and king tracking in sync."""
+        sq = position.row * 8 + position.col
+        piece = self._squares[sq]
+        if piece is None:
+            return
+        self.version += 1
+        self._squares[sq] = None
+        mask = ~(1 << sq)
+        self.bitboards[piece.piece_type] &= mask
+        self.occupancy[piece.color] &= mask
+        if piece.piece_type is PieceType.KING and self.king_pos[piece.color] == position:
+            self.king_pos[piece.color] = None
+    
     def move_piece(self, from_pos: Position, to_pos: Position) -> Optional[Piece]:
         """
         Move a piece from one position to another.
@@ -60,12 +93,7 @@ class Board:
     
     def find_king(self, color: Color) -> Optional[Position]:
         """Find the position of the king for the given color."""
-        for row in range(8):
-            for col in range(8):
-                piece = self._board[row][col]
-                if piece and piece.color == color and piece.piece_type == PieceType.KING:
-                    return Position(row, col)
-        return None
+        return self.king_pos[color]
     
     def get_all_pieces(self, color: Optional[Color] = None) -> List[tuple[Position, Piece]]:
         """
@@ -73,39 +101,50 @@ class Board:
         Returns list of (position, piece) tuples.
         """
         pieces = []
-        for row in range(8):
-            for col in range(8):
-                piece = self._board[row][col]
-                if piece and (color is None or piece.color == color):
-                    pieces.append((Position(row, col), piece))
+        for sq, piece in enumerate(self._squares):
+            if piece and (color is None or piece.color == color):
+                pieces.append((Position.of(sq >> 3, sq & 7), piece))
         return pieces
     
     def is_position_attacked(self, position: Position, by_color: Color) -> bool:
         """
         Check if a position is attacked by any piece of the given color.
         This is used for check detection and castling validation.
+        Answered with bitboard lookups rather than generating moves.
         """
-        # Check all pieces of the attacking color
-        for piece_pos, piece in self.get_all_pieces(by_color):
-            # Get possible moves for this piece
-            possible_moves = piece.get_possible_moves(piece_pos, self)
-            
-            # Check if any move targets the position
-            for move in possible_moves:
-                if move.to_pos == position:
-                    # Don't consider castling moves for attack detection
-                    if move.move_type not in [move.move_type.CASTLING_KINGSIDE, 
-                                             move.move_type.CASTLING_QUEENSIDE]:
-                        return True
+        sq = position.row * 8 + position.col
+        attackers = self.occupancy[by_color]
+        bitboards = self.bitboards
+        
+        if KNIGHT_ATTACKS[sq] & bitboards[PieceType.KNIGHT] & attackers:
+            return True
+        if KING_ATTACKS[sq] & bitboards[PieceType.KING] & attackers:
+            return True
+        # A pawn attacks sq from the squares a pawn of the other color on sq would attack
+        if PAWN_ATTACKS[by_color.opposite()][sq] & bitboards[PieceType.PAWN] & attackers:
+            return True
+        
+        occ = self.occupancy[Color.WHITE] | self.occupancy[Color.BLACK]
+        queens = bitboards[PieceType.QUEEN]
+        if rook_attacks(sq, occ) & (bitboards[PieceType.ROOK] | queens) & attackers:
+            return True
+        if bishop_attacks(sq, occ) & (bitboards[PieceType.BISHOP] | queens) & attackers:
+            return True
         
         return False
     
     def copy(self) -> 'Board':
-        """Create a deep copy of the board."""
+        """
+        Create an independent copy of the board.
+        Pieces are shared immutable instances, so only the squares are copied.
+        """
         new_board = Board()
-        new_board._board = copy.deepcopy(self._board)
+        new_board._squares = self._squares[:]
         new_board.castling_rights = self.castling_rights.copy()
         new_board.en_passant_target = self.en_passant_target
+        new_board.king_pos = self.king_pos.copy()
+        new_board.bitboards = self.bitboards.copy()
+        new_board.occupancy = self.occupancy.copy()
         return new_board
     
     def to_string_board(self) -> List[List[Optional[str]]]:
@@ -117,7 +156,7 @@ class Board:
         for row in range(8):
             string_row = []
             for col in range(8):
-                piece = self._board[row][col]
+                piece = self._squares[row * 8 + col]
                 if piece:
                     string_row.append(piece.to_string_notation())
                 else:
@@ -136,7 +175,7 @@ class Board:
             for col in range(8):
                 piece_str = string_board[row][col]
                 if piece_str:
-                    board._board[row][col] = piece_from_string(piece_str)
+                    board.set_piece(Position(row, col), piece_from_string(piece_str))
         return board
     
     def __str__(self) -> str:
@@ -145,10 +184,10 @@ class Board:
         for row in range(8):
             row_str = f"{8 - row} "
             for col in range(8):
-                piece = self._board[row][col]
+                piece = self._squares[row * 8 + col]
                 if piece:
                     # Use first letter of color and piece type
-                    symbol = piece.color.value[0] + piece.piece_type.value[0].upper()
+                    symbol = str(piece.color)[0] + str(piece.piece_type)[0].upper()
                     row_str += f"{symbol:3}"
                 else:
                     row_str += " . "
@@ -39,7 +39,7 @@ class ChessGame:
     @property
     def turn(self) -> str:
         """Get current turn as string for backwards compatibility."""
-        return self.game_state.current_turn.value
+        return str(self.game_state.current_turn)
     
     @property
     def game_over(self) -> bool:
@@ -93,17 +93,17 @@ class ChessGame:
                 # Execute the move
                 if self.game_state.make_move(target_move):
                     self.last_move = (target_move.from_pos, target_move.to_pos)
-                    if piece_type:
+                    if piece_type is not None:
                         print(f"Move: {self.game_state.get_move_notation(target_move, piece_type)}")
                     
                     # Check game status
                     if self.game_state.game_status == GameStatus.CHECKMATE:
                         winner = self.game_state.get_winner()
-                        print(f"\n!!! CHECKMATE !!! {winner.value.upper()} WINS!")
+                        print(f"\n!!! CHECKMATE !!! {str(winner).upper()} WINS!")
                     elif self.game_state.game_status == GameStatus.STALEMATE:
                         print("\n!!! STALEMATE !!! It's a DRAW!")
                     elif self.game_state.game_status == GameStatus.CHECK:
-                        print(f"!!! {self.game_state.current_turn.value.upper()} KING IS IN CHECK !!!")
+                        print(f"!!! {str(self.game_state.current_turn).upper()} KING IS IN CHECK !!!")
                     elif self.game_state.game_status == GameStatus.DRAW:
                         print("\n!!! DRAW by 50-move rule!")
                     
@@ -112,13 +112,13 @@ class ChessGame:
                     print("Move failed")
             else:
                 # Not a valid move, check if clicking another piece of same color
-                if piece_at_click and piece_at_click.color.value == self.turn:
+                if piece_at_click and piece_at_click.color == self.game_state.current_turn:
                     self.game_state.selected_position = clicked_position
                 else:
                     self.game_state.selected_position = None
         else:
             # No piece selected, try to select one
-            if piece_at_click and piece_at_click.color.value == self.turn:
+            if piece_at_click and piece_at_click.color == self.game_state.current_turn:
                 self.game_state.selected_position = clicked_position
             else:
                 print(f"It's {self.turn}'s turn. Cannot select opponent's piece or empty square.")
@@ -142,14 +142,13 @@ class ChessGame:
             self.renderer = Renderer(screen, square_size, pieces_images)
             self.renderer.set_colors(light_color, dark_color, highlight_color)
         
-        # Get legal moves for selected piece
-        legal_move_positions = []
+        # Get legal move destinations for selected piece
+        legal_targets = 0
         if self.game_state.selected_position:
-            legal_moves = self.game_state.get_legal_moves_for_position(self.game_state.selected_position)
-            legal_move_positions = [move.to_pos for move in legal_moves]
+            legal_targets = self.game_state.get_legal_targets(self.game_state.selected_position)
         
         # Draw the board
-        self.renderer.draw_board(self.game_state, legal_move_positions, self.last_move, animating_position)
+        self.renderer.draw_board(self.game_state, legal_targets, self.last_move, animating_position)
         
         # Draw game over message if applicable
         if self.game_state.is_game_over():
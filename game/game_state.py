@@ -1,7 +1,8 @@
 """
 Game state management including turn tracking, move history, and game status.
 """
-from typing import List, Optional, TYPE_CHECKING
+from bisect import insort
+from typing import Dict, List, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 from game.types import Color, Position, Move, GameStatus, MoveType, PieceType
@@ -13,6 +14,21 @@ if TYPE_CHECKING:
     from game.pieces import Piece
 
 
+# Material value of each capturable piece type, for the captured-piece tallies
+MATERIAL_VALUES = {
+    PieceType.PAWN: 1,
+    PieceType.KNIGHT: 3,
+    PieceType.BISHOP: 3,
+    PieceType.ROOK: 5,
+    PieceType.QUEEN: 9,
+}
+
+
+def _capture_order(piece_type: PieceType) -> int:
+    """Sort key listing captured pieces from most to least valuable."""
+    return -MATERIAL_VALUES.get(piece_type, 0)
+
+
 @dataclass
 class GameState:
     """
@@ -34,11 +50,23 @@ class GameState:
     selected_position: Optional[Position] = None
     captured_by_white: List[PieceType] = field(default_factory=list)  # Pieces captured by white
     captured_by_black: List[PieceType] = field(default_factory=list)  # Pieces captured by black
+    # Same captures ordered by value, and their material totals, kept up to date
+    # as pieces are taken and restored so the sidebar never re-sorts or re-sums
+    captured_by_white_sorted: List[PieceType] = field(default_factory=list)
+    captured_by_black_sorted: List[PieceType] = field(default_factory=list)
+    white_material: int = 0
+    black_material: int = 0
     redo_stack: List[Move] = field(default_factory=list)  # For redo functionality
     
     def __post_init__(self):
         """Initialize the validator after the state is created."""
         self.validator = MoveValidator(self.board)
+        
+        # Legal moves cached until the board changes
+        self._legal_moves_cache: Dict[Position, List[Move]] = {}
+        self._all_legal_moves_cache: Dict[Color, List[Move]] = {}
+        self._legal_targets_cache: Dict[Position, int] = {}
+        self._move_cache_version = self.board.version
     
     def make_move(self, move: Move) -> bool:
         """
@@ -81,6 +109,7 @@ class GameState:
         
         # Update validator for new board state
         self.validator = MoveValidator(self.board)
+        self._invalidate_move_cache()
         
         # Update game status
         self._update_game_status()
@@ -95,10 +124,7 @@ class GameState:
         if move.move_type == MoveType.CAPTURE or move.move_type == MoveType.PROMOTION:
             captured_piece = self.board.get_piece(move.to_pos)
             if captured_piece:
-                if piece.color == Color.WHITE:
-                    self.captured_by_white.append(captured_piece.piece_type)
-                else:
-                    self.captured_by_black.append(captured_piece.piece_type)
+                self._record_capture(piece.color, captured_piece.piece_type)
         
         # Clear en passant target from previous move
         self.board.en_passant_target = None
@@ -122,30 +148,51 @@ class GameState:
         # Update castling rights based on piece movement
         self._update_castling_rights(move, piece)
     
+    def _record_capture(self, capturer: Color, piece_type: PieceType):
+        """Add a captured piece to the capturer's lists and material tally."""
+        if capturer == Color.WHITE:
+            self.captured_by_white.append(piece_type)
+            insort(self.captured_by_white_sorted, piece_type, key=_capture_order)
+            self.white_material += MATERIAL_VALUES.get(piece_type, 0)
+        else:
+            self.captured_by_black.append(piece_type)
+            insort(self.captured_by_black_sorted, piece_type, key=_capture_order)
+            self.black_material += MATERIAL_VALUES.get(piece_type, 0)
+    
+    def _forget_capture(self, capturer: Color, piece_type: PieceType):
+        """Undo _record_capture when a captured piece goes back on the board."""
+        if capturer == Color.WHITE:
+            if piece_type in self.captured_by_white:
+                self.captured_by_white.remove(piece_type)
+                self.captured_by_white_sorted.remove(piece_type)
+                self.white_material -= MATERIAL_VALUES.get(piece_type, 0)
+        else:
+            if piece_type in self.captured_by_black:
+                self.captured_by_black.remove(piece_type)
+                self.captured_by_black_sorted.remove(piece_type)
+                self.black_material -= MATERIAL_VALUES.get(piece_type, 0)
+    
     def _execute_castling_kingside(self, move: Move, piece: 'Piece'):
         """Execute kingside castling."""
         row = move.from_pos.row
         self.board.move_piece(move.from_pos, move.to_pos)  # Move king
-        self.board.move_piece(Position(row, 7), Position(row, 5))  # Move rook
+        self.board.move_piece(Position.of(row, 7), Position.of(row, 5))  # Move rook
         self.board.castling_rights.remove_rights(piece.color)
     
     def _execute_castling_queenside(self, move: Move, piece: 'Piece'):
         """Execute queenside castling."""
         row = move.from_pos.row
         self.board.move_piece(move.from_pos, move.to_pos)  # Move king
-        self.board.move_piece(Position(row, 0), Position(row, 3))  # Move rook
+        self.board.move_piece(Position.of(row, 0), Position.of(row, 3))  # Move rook
         self.board.castling_rights.remove_rights(piece.color)
     
     def _execute_en_passant(self, move: Move, piece: 'Piece'):
         """Execute en passant capture."""
         # Track captured pawn
-        captured_pawn_pos = Position(move.from_pos.row, move.to_pos.col)
+        captured_pawn_pos = Position.of(move.from_pos.row, move.to_pos.col)
         captured_pawn = self.board.get_piece(captured_pawn_pos)
         if captured_pawn:
-            if piece.color == Color.WHITE:
-                self.captured_by_white.append(captured_pawn.piece_type)
-            else:
-                self.captured_by_black.append(captured_pawn.piece_type)
+            self._record_capture(piece.color, captured_pawn.piece_type)
         
         self.board.move_piece(move.from_pos, move.to_pos)
         self.board.remove_piece(captured_pawn_pos)
@@ -161,7 +208,7 @@ class GameState:
         self.board.move_piece(move.from_pos, move.to_pos)
         direction = -1 if piece.color == Color.WHITE else 1
         en_passant_row = move.from_pos.row + direction
-        self.board.en_passant_target = Position(en_passant_row, move.from_pos.col)
+        self.board.en_passant_target = Position.of(en_passant_row, move.from_pos.col)
     
     def _update_castling_rights(self, move: Move, piece: 'Piece'):
         """Update castling rights based on piece movement."""
@@ -189,13 +236,55 @@ class GameState:
         else:
             self.game_status = GameStatus.ACTIVE
     
+    def _invalidate_move_cache(self):
+        """Drop cached legal moves after the position changes."""
+        self._legal_moves_cache.clear()
+        self._all_legal_moves_cache.clear()
+        self._legal_targets_cache.clear()
+        self._move_cache_version = self.board.version
+    
+    def _sync_move_cache(self):
+        """Invalidate the cache if the board was changed behind our back."""
+        if self._move_cache_version != self.board.version:
+            self._invalidate_move_cache()
+    
     def get_legal_moves_for_position(self, position: Position) -> List[Move]:
-        """Get all legal moves for a piece at the given position."""
-        return self.validator.get_legal_moves(position)
+        """
+        Get all legal moves for a piece at the given position.
+        The returned list is cached and shared; don't modify it.
+        """
+        self._sync_move_cache()
+        moves = self._legal_moves_cache.get(position)
+        if moves is None:
+            moves = self.validator.get_legal_moves(position)
+            self._legal_moves_cache[position] = moves
+        return moves
+    
+    def get_legal_targets(self, position: Position) -> int:
+        """
+        Get the destination squares of the piece at the given position as a
+        bitboard (bit row * 8 + col), for highlighting without a list.
+        """
+        self._sync_move_cache()
+        targets = self._legal_targets_cache.get(position)
+        if targets is None:
+            targets = 0
+            for move in self.get_legal_moves_for_position(position):
+                targets |= 1 << (move.to_pos.row * 8 + move.to_pos.col)
+            self._legal_targets_cache[position] = targets
+        return targets
     
     def get_all_legal_moves(self) -> List[Move]:
-        """Get all legal moves for the current player."""
-        return self.validator.get_all_legal_moves(self.current_turn)
+        """
+        Get all legal moves for the current player.
+        The returned list is cached and shared; don't modify it.
+        """
+        self._sync_move_cache()
+        moves = self._all_legal_moves_cache.get(self.current_turn)
+        if moves is None:
+            moves = self.validator.get_all_legal_moves(self.current_turn)
+            self._all_legal_moves_cache[self.current_turn] = moves
+        return moves
     
     def is_game_over(self) -> bool:
         """Check if the game is over."""
@@ -280,6 +369,7 @@ class GameState:
         
         # Update validator
         self.validator = MoveValidator(self.board)
+        self._invalidate_move_cache()
         
         # Update game status
         self._update_game_status()
@@ -326,6 +416,7 @@ class GameState:
         
         # Update validator
         self.validator = MoveValidator(self.board)
+        self._invalidate_move_cache()
         
         # Update game status
         self._update_game_status()
@@ -343,46 +434,37 @@ class GameState:
             # Reverse kingside castling
             row = move.to_pos.row
             self.board.move_piece(move.to_pos, move.from_pos)  # Move king back
-            self.board.move_piece(Position(row, 5), Position(row, 7))  # Move rook back
+            self.board.move_piece(Position.of(row, 5), Position.of(row, 7))  # Move rook back
         
         elif move.move_type == MoveType.CASTLING_QUEENSIDE:
             # Reverse queenside castling
             row = move.to_pos.row
             self.board.move_piece(move.to_pos, move.from_pos)  # Move king back
-            self.board.move_piece(Position(row, 3), Position(row, 0))  # Move rook back
+            self.board.move_piece(Position.of(row, 3), Position.of(row, 0))  # Move rook back
         
         elif move.move_type == MoveType.EN_PASSANT:
             # Reverse en passant
             self.board.move_piece(move.to_pos, move.from_pos)
             # Restore captured pawn
-            captured_pawn_pos = Position(move.from_pos.row, move.to_pos.col)
+            captured_pawn_pos = Position.of(move.from_pos.row, move.to_pos.col)
             if move.captured_piece:
                 self.board.set_piece(captured_pawn_pos, move.captured_piece)
                 # Remove from captured list
-                if piece and piece.color == Color.WHITE:
-                    if move.captured_piece.piece_type in self.captured_by_white:
-                        self.captured_by_white.remove(move.captured_piece.piece_type)
-                elif piece:
-                    if move.captured_piece.piece_type in self.captured_by_black:
-                        self.captured_by_black.remove(move.captured_piece.piece_type)
+                if piece:
+                    self._forget_capture(piece.color, move.captured_piece.piece_type)
         
         elif move.move_type == MoveType.PROMOTION:
             # Reverse promotion - restore pawn
             self.board.remove_piece(move.to_pos)
             if piece:
-                from game.pieces import Pawn
-                pawn = Pawn(piece.color)
+                pawn = create_piece(piece.color, PieceType.PAWN)
                 self.board.set_piece(move.from_pos, pawn)
             # Restore captured piece if any
             if move.captured_piece:
                 self.board.set_piece(move.to_pos, move.captured_piece)
                 # Remove from captured list
-                if piece and piece.color == Color.WHITE:
-                    if move.captured_piece.piece_type in self.captured_by_white:
-                        self.captured_by_white.remove(move.captured_piece.piece_type)
-                elif piece:
-                    if move.captured_piece.piece_type in self.captured_by_black:
-                        self.captured_by_black.remove(move.captured_piece.piece_type)
+                if piece:
+                    self._forget_capture(piece.color, move.captured_piece.piece_type)
         
         else:
             # Normal move, capture, or pawn double move
@@ -391,9 +473,5 @@ class GameState:
             if move.captured_piece:
                 self.board.set_piece(move.to_pos, move.captured_piece)
                 # Remove from captured list
-                if piece and piece.color == Color.WHITE:
-                    if move.captured_piece.piece_type in self.captured_by_white:
-                        self.captured_by_white.remove(move.captured_piece.piece_type)
-                elif piece:
-                    if move.captured_piece.piece_type in self.captured_by_black:
-                        self.captured_by_black.remove(move.captured_piece.piece_type)
+                if piece:
+                    self._forget_capture(piece.color, move.captured_piece.piece_type)
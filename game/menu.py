@@ -3,7 +3,18 @@ Menu system for Chess Champion.
 Allows players to select difficulty level and color before starting the game.
 """
 import pygame
-from typing import Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+
+# The only event types the menus handle
+MENU_EVENTS = [pygame.QUIT, pygame.MOUSEBUTTONDOWN]
+
+
+def _queue_only(event_types: List[int]):
+    """Block every event type except `event_types` from entering the queue."""
+    # set_allowed() alone leaves every other type enabled, so block all first
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(event_types)
 
 
 class Button:
@@ -30,28 +41,45 @@ class Button:
         self.text_color = text_color
         self.is_selected = False
         self.selected_color = (100, 200, 100)  # Green for selected state
+        self.state = 'normal'  # 'normal', 'hover' or 'selected'
         
-    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
-        """Draw the button on the screen."""
-        mouse_pos = pygame.mouse.get_pos()
-        is_hovering = self.rect.collidepoint(mouse_pos)
-        
-        # Choose color based on state
+        # Pre-rendered surfaces, built on first draw with the given font
+        self._font: Optional[pygame.font.Font] = None
+        self._bg: Dict[str, pygame.Surface] = {}
+        self._text_surface: Optional[pygame.Surface] = None
+        self._text_rect: Optional[pygame.Rect] = None
+    
+    def _render_surfaces(self, font: pygame.font.Font):
+        """Pre-render the background for each state and the label text."""
+        self._bg = {}
+        for state, color in (('normal', self.color), ('hover', self.hover_color),
+                             ('selected', self.selected_color)):
+            surface = pygame.Surface(self.rect.size, pygame.SRCALPHA).convert_alpha()
+            local_rect = surface.get_rect()
+            pygame.draw.rect(surface, color, local_rect, border_radius=10)
+            pygame.draw.rect(surface, (0, 0, 0), local_rect, width=2, border_radius=10)
+            self._bg[state] = surface
+        
+        self._text_surface = font.render(self.text, True, self.text_color).convert_alpha()
+        self._text_rect = self._text_surface.get_rect(center=self.rect.center)
+        self._font = font
+    
+    def update_state(self, mouse_pos: Tuple[int, int]):
+        """Update the visual state from the mouse position for this frame."""
         if self.is_selected:
-            current_color = self.selected_color
-        elif is_hovering:
-            current_color = self.hover_color
+            self.state = 'selected'
+        elif self.rect.collidepoint(mouse_pos):
+            self.state = 'hover'
         else:
-            current_color = self.color
+            self.state = 'normal'
         
-        # Draw button rectangle
-        pygame.draw.rect(screen, current_color, self.rect, border_radius=10)
-        pygame.draw.rect(screen, (0, 0, 0), self.rect, width=2, border_radius=10)
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font):
+        """Draw the button on the screen using its current state."""
+        if font is not self._font:
+            self._render_surfaces(font)
         
-        # Draw text
-        text_surface = font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        screen.blit(self._bg[self.state], self.rect.topleft)
+        screen.blit(self._text_surface, self._text_rect)
         
     def is_clicked(self, mouse_pos: Tuple[int, int]) -> bool:
         """Check if the button was clicked."""
@@ -167,12 +195,46 @@ class Menu:
         
         self.start_button = Button(start_x, start_y, start_width, start_height,
                                    'Start Game', self.start_color, self.start_hover)
+        
+        self._build_hit_table()
+    
+    def _build_hit_table(self):
+        """List the static button rects with the (group, key) each belongs to."""
+        entries = [(('mode', key), button) for key, button in self.mode_buttons.items()]
+        entries += [(('difficulty', key), button) for key, button in self.difficulty_buttons.items()]
+        entries += [(('color', key), button) for key, button in self.color_buttons.items()]
+        entries.append((('start', None), self.start_button))
+        
+        self._button_keys = [key for key, _ in entries]
+        self._button_rects = [button.rect for _, button in entries]
+    
+    def _button_at(self, mouse_pos: Tuple[int, int]) -> Optional[Tuple[str, Optional[str]]]:
+        """Return the (group, key) of the button under mouse_pos, if any."""
+        # A one-pixel rect at the mouse tests every button in a single call
+        index = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._button_rects)
+        if index < 0:
+            return None
+        return self._button_keys[index]
+    
+    @staticmethod
+    def _select(buttons: Dict[str, Button], key: str):
+        """Deselect all buttons in the group and select the clicked one."""
+        for btn in buttons.values():
+            btn.is_selected = False
+        buttons[key].is_selected = True
     
     def draw(self):
         """Draw the menu."""
         # Background
         self.screen.fill(self.bg_color)
         
+        # Resolve hover/selected state once per frame
+        mouse_pos = pygame.mouse.get_pos()
+        for buttons in (self.mode_buttons, self.difficulty_buttons, self.color_buttons):
+            for button in buttons.values():
+                button.update_state(mouse_pos)
+        self.start_button.update_state(mouse_pos)
+        
         # Title
         title_text = self.title_font.render('Chess Champion', True, self.title_color)
         title_rect = title_text.get_rect(center=(self.width // 2, 100))
@@ -239,62 +301,47 @@ class Menu:
         Returns:
             Tuple of (mode, difficulty, color, depth) if start button clicked, None otherwise
         """
-        # Check game mode buttons
-        for mode, button in self.mode_buttons.items():
-            if button.is_clicked(mouse_pos):
-                # Deselect all mode buttons
-                for btn in self.mode_buttons.values():
-                    btn.is_selected = False
-                # Select clicked button
-                button.is_selected = True
-                self.selected_mode = mode
-                return None
-        
-        # Check difficulty buttons (only relevant for AI mode)
-        if self.selected_mode == 'pvai':
-            for difficulty, button in self.difficulty_buttons.items():
-                if button.is_clicked(mouse_pos):
-                    # Deselect all difficulty buttons
-                    for btn in self.difficulty_buttons.values():
-                        btn.is_selected = False
-                    # Select clicked button
-                    button.is_selected = True
-                    self.selected_difficulty = difficulty
-                    return None
-            
-            # Check color buttons (only relevant for AI mode)
-            for color, button in self.color_buttons.items():
-                if button.is_clicked(mouse_pos):
-                    # Deselect all color buttons
-                    for btn in self.color_buttons.values():
-                        btn.is_selected = False
-                    # Select clicked button
-                    button.is_selected = True
-                    self.selected_color = color
-                    return None
-        
-        # Check start button
-        if self.start_button.is_clicked(mouse_pos):
-            if self.selected_mode == 'pvp':
-                # Player vs Player - no AI
-                return ('pvp', 'none', 'white', 0)
-            else:
-                # Player vs AI
-                # Map difficulty to depth
-                depth_map = {
-                    'easy': 1,
-                    'medium': 2,
-                    'hard': 3,
-                    'expert': 4
-                }
-                depth = depth_map[self.selected_difficulty]
-                
-                # Determine AI color (opposite of player)
-                ai_color = 'black' if self.selected_color == 'white' else 'white'
-                
-                return ('pvai', self.selected_difficulty, ai_color, depth)
+        hit = self._button_at(mouse_pos)
+        if hit is None:
+            return None
+        group, key = hit
+        
+        # Difficulty and color buttons are only relevant for AI mode
+        if group in ('difficulty', 'color') and self.selected_mode != 'pvai':
+            return None
+        
+        if group == 'mode':
+            self._select(self.mode_buttons, key)
+            self.selected_mode = key
+            return None
+        if group == 'difficulty':
+            self._select(self.difficulty_buttons, key)
+            self.selected_difficulty = key
+            return None
+        if group == 'color':
+            self._select(self.color_buttons, key)
+            self.selected_color = key
+            return None
         
-        return None
+        # Start button
+        if self.selected_mode == 'pvp':
+            # Player vs Player - no AI
+            return ('pvp', 'none', 'white', 0)
+        else:
+            # Player vs AI
+            # Map difficulty to depth
+            depth_map = {
+                'easy': 1,
+                'medium': 2,
+                'hard': 3,
+                'expert': 4
+            }
+            depth = depth_map[self.selected_difficulty]
+            
+            # Determine AI color (opposite of player)
+            ai_color = 'black' if self.selected_color == 'white' else 'white'
+            
+            return ('pvai', self.selected_difficulty, ai_color, depth)
     
     def run(self) -> Tuple[str, str, str, int]:
         """
@@ -306,19 +353,24 @@ class Menu:
         clock = pygame.time.Clock()
         running = True
         
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    exit()
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    result = self.handle_click(event.pos)
-                    if result:
-                        return result
-            
-            self.draw()
-            pygame.display.flip()
-            clock.tick(60)
+        # Only queue the events the menu handles; mouse motion is dropped by SDL
+        _queue_only(MENU_EVENTS)
+        try:
+            while running:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        exit()
+                    elif event.type == pygame.MOUSEBUTTONDOWN:
+                        result = self.handle_click(event.pos)
+                        if result:
+                            return result
+                
+                self.draw()
+                pygame.display.flip()
+                clock.tick(60)
+        finally:
+            pygame.event.set_allowed(None)
 
 
 class GameOverMenu:
@@ -354,9 +406,31 @@ class GameOverMenu:
         self.end_game_color = (178, 34, 34)  # Firebrick red
         self.end_game_hover = (220, 20, 60)  # Crimson
         
+        # Semi-transparent overlay, built once in the display's pixel format
+        self._overlay = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        self._overlay.fill(self.overlay_color)
+        
+        # The title and result never change for a given menu, so render them once
+        self._render_text()
+        
         # Create buttons
         self._create_buttons()
     
+    def _render_text(self):
+        """Pre-render the title and winner/result subtitle."""
+        self._title_text = self.title_font.render('Game Over', True, self.title_color).convert_alpha()
+        self._title_rect = self._title_text.get_rect(center=(self.width // 2, self.height // 2 - 120))
+        
+        if self.winner:
+            result_text = f"{self.winner.upper()} Wins!"
+            result_color = (255, 255, 255)
+        else:
+            result_text = "It's a Draw!"
+            result_color = (200, 200, 200)
+        
+        self._subtitle = self.subtitle_font.render(result_text, True, result_color).convert_alpha()
+        self._subtitle_rect = self._subtitle.get_rect(center=(self.width // 2, self.height // 2 - 50))
+    
     def _create_buttons(self):
         """Create menu buttons."""
         button_width = 250
@@ -386,28 +460,16 @@ class GameOverMenu:
             game_surface: The current game screen to draw over
         """
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill(self.overlay_color)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay, (0, 0))
         
-        # Game Over title
-        title_text = self.title_font.render('Game Over', True, self.title_color)
-        title_rect = title_text.get_rect(center=(self.width // 2, self.height // 2 - 120))
-        self.screen.blit(title_text, title_rect)
-        
-        # Winner/result subtitle
-        if self.winner:
-            result_text = f"{self.winner.upper()} Wins!"
-            result_color = (255, 255, 255)
-        else:
-            result_text = "It's a Draw!"
-            result_color = (200, 200, 200)
-        
-        subtitle = self.subtitle_font.render(result_text, True, result_color)
-        subtitle_rect = subtitle.get_rect(center=(self.width // 2, self.height // 2 - 50))
-        self.screen.blit(subtitle, subtitle_rect)
+        # Game Over title and winner/result subtitle
+        self.screen.blit(self._title_text, self._title_rect)
+        self.screen.blit(self._subtitle, self._subtitle_rect)
         
         # Draw buttons
+        mouse_pos = pygame.mouse.get_pos()
+        self.new_game_button.update_state(mouse_pos)
+        self.end_game_button.update_state(mouse_pos)
         self.new_game_button.draw(self.screen, self.button_font)
         self.end_game_button.draw(self.screen, self.button_font)
     
@@ -437,15 +499,20 @@ class GameOverMenu:
         clock = pygame.time.Clock()
         running = True
         
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return 'end_game'
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    result = self.handle_click(event.pos)
-                    if result:
-                        return result
-            
-            self.draw(None)
-            pygame.display.flip()
-            clock.tick(60)
+        # Only queue the events the menu handles; mouse motion is dropped by SDL
+        _queue_only(MENU_EVENTS)
+        try:
+            while running:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return 'end_game'
+                    elif event.type == pygame.MOUSEBUTTONDOWN:
+                        result = self.handle_click(event.pos)
+                        if result:
+                            return result
+                
+                self.draw(None)
+                pygame.display.flip()
+                clock.tick(60)
+        finally:
+            pygame.event.set_allowed(None)
@@ -4,9 +4,26 @@ Move validation logic separated from game state.
 from typing import List, Optional
 import copy
 
-from game.types import Color, Position, Move, MoveType
+from game.types import Color, Position, Move, MoveType, PieceType
 from game.board import Board
-from game.pieces import Piece
+from game.pieces import Piece, create_piece
+
+
+_CASTLING_MOVE_TYPES = (MoveType.CASTLING_KINGSIDE, MoveType.CASTLING_QUEENSIDE)
+
+# Castling parameters (columns and paths) keyed by "is kingside"
+_CASTLING_PARAMS = {
+    True: {
+        'rook_col': 7,
+        'king_path': (5, 6),  # f and g files
+        'clear_cols': (5, 6)   # Squares that must be empty
+    },
+    False: {
+        'rook_col': 0,
+        'king_path': (3, 2),  # d and c files
+        'clear_cols': (1, 2, 3)  # b, c, d files must be empty
+    }
+}
 
 
 class MoveValidator:
@@ -15,38 +32,44 @@ class MoveValidator:
     Handles check detection, checkmate, stalemate, and special moves.
     """
     
+    __slots__ = ('board',)
+    
     def __init__(self, board: Board):
         self.board = board
     
-    def is_king_in_check(self, color: Color) -> bool:
-        """Check if the king of the given color is in check."""
-        king_pos = self.board.find_king(color)
+    def is_king_in_check(self, color: Color, board: Optional[Board] = None) -> bool:
+        """
+        Check if the king of the given color is in check.
+        Checks the validator's own board unless another board is given.
+        """
+        board = board or self.board
+        king_pos = board.find_king(color)
         if king_pos is None:
             return False
         
         opponent_color = color.opposite()
-        return self.board.is_position_attacked(king_pos, opponent_color)
+        return board.is_position_attacked(king_pos, opponent_color)
     
     def is_move_legal(self, move: Move) -> bool:
         """
         Check if a move is legal (doesn't leave king in check).
         This is the final validation after piece movement rules.
         """
-        piece = self.board.get_piece(move.from_pos)
+        board = self.board
+        piece = board.get_piece(move.from_pos)
         if piece is None:
             return False
         
         # Special handling for castling
-        if move.move_type in [MoveType.CASTLING_KINGSIDE, MoveType.CASTLING_QUEENSIDE]:
+        if move.move_type in _CASTLING_MOVE_TYPES:
             return self._validate_castling(move, piece.color)
         
         # Simulate the move
-        temp_board = self.board.copy()
+        temp_board = board.copy()
         self._execute_move_on_board(temp_board, move)
         
         # Check if king is in check after the move
-        validator = MoveValidator(temp_board)
-        return not validator.is_king_in_check(piece.color)
+        return not self.is_king_in_check(piece.color, temp_board)
     
     def _validate_castling(self, move: Move, color: Color) -> bool:
         """Validate castling move with all special rules."""
@@ -81,38 +104,29 @@ class MoveValidator:
     
     def _get_castling_params(self, is_kingside: bool) -> dict:
         """Get castling parameters (columns and paths) based on side."""
-        if is_kingside:
-            return {
-                'rook_col': 7,
-                'king_path': [5, 6],  # f and g files
-                'clear_cols': [5, 6]   # Squares that must be empty
-            }
-        else:
-            return {
-                'rook_col': 0,
-                'king_path': [3, 2],  # d and c files
-                'clear_cols': [1, 2, 3]  # b, c, d files must be empty
-            }
+        return _CASTLING_PARAMS[is_kingside]
     
     def _is_castling_path_clear(self, row: int, params: dict) -> bool:
         """Check if all squares between king and rook are empty."""
+        board = self.board
         for col in params['clear_cols']:
-            if self.board.get_piece(Position(row, col)) is not None:
+            if board.get_piece(Position.of(row, col)) is not None:
                 return False
         return True
     
     def _is_rook_valid(self, row: int, rook_col: int, color: Color) -> bool:
         """Check if rook is present and correct color."""
-        rook = self.board.get_piece(Position(row, rook_col))
+        rook = self.board.get_piece(Position.of(row, rook_col))
         return (rook is not None and 
-                rook.piece_type.value == 'rook' and 
-                rook.color == color)
+                rook.piece_type is PieceType.ROOK and 
+                rook.color is color)
     
-    def _is_castling_path_safe(self, row: int, path_cols: list, color: Color) -> bool:
+    def _is_castling_path_safe(self, row: int, path_cols: tuple, color: Color) -> bool:
         """Check if king doesn't pass through or land on attacked squares."""
+        board = self.board
         opponent_color = color.opposite()
         for col in path_cols:
-            if self.board.is_position_attacked(Position(row, col), opponent_color):
+            if board.is_position_attacked(Position.of(row, col), opponent_color):
                 return False
         return True
     
@@ -135,17 +149,25 @@ class MoveValidator:
     
     def get_all_legal_moves(self, color: Color) -> List[Move]:
         """Get all legal moves for all pieces of the given color."""
-        all_moves = []
-        
+        # Gather every piece's candidates into one list rather than one per piece
+        candidates: List[Move] = []
         for position, piece in self.board.get_all_pieces(color):
-            moves = self.get_legal_moves(position)
-            all_moves.extend(moves)
+            piece.get_possible_moves(position, self.board, candidates)
         
-        return all_moves
+        return [move for move in candidates if self.is_move_legal(move)]
     
     def has_legal_moves(self, color: Color) -> bool:
-        """Check if the given color has any legal moves."""
-        return len(self.get_all_legal_moves(color)) > 0
+        """
+        Check if the given color has any legal moves.
+        Stops at the first legal move instead of building the full list.
+        """
+        candidates: List[Move] = []
+        for position, piece in self.board.get_all_pieces(color):
+            candidates.clear()
+            for move in piece.get_possible_moves(position, self.board, candidates):
+                if self.is_move_legal(move):
+                    return True
+        return False
     
     def _execute_move_on_board(self, board: Board, move: Move):
         """
@@ -156,39 +178,43 @@ class MoveValidator:
         if piece is None:
             return
         
-        if move.move_type == MoveType.CASTLING_KINGSIDE:
-            # Move king
-            board.move_piece(move.from_pos, move.to_pos)
-            # Move rook
-            row = move.from_pos.row
-            rook_from = Position(row, 7)
-            rook_to = Position(row, 5)
-            board.move_piece(rook_from, rook_to)
-        
-        elif move.move_type == MoveType.CASTLING_QUEENSIDE:
-            # Move king
-            board.move_piece(move.from_pos, move.to_pos)
-            # Move rook
-            row = move.from_pos.row
-            rook_from = Position(row, 0)
-            rook_to = Position(row, 3)
-            board.move_piece(rook_from, rook_to)
-        
-        elif move.move_type == MoveType.EN_PASSANT:
-            # Move pawn
-            board.move_piece(move.from_pos, move.to_pos)
-            # Remove captured pawn
-            captured_pawn_pos = Position(move.from_pos.row, move.to_pos.col)
-            board.remove_piece(captured_pawn_pos)
-        
-        elif move.move_type == MoveType.PROMOTION:
-            # Remove pawn
-            board.remove_piece(move.from_pos)
-            # Place promoted piece
-            from game.pieces import create_piece
-            promoted_piece = create_piece(piece.color, move.promotion_piece)
-            board.set_piece(move.to_pos, promoted_piece)
-        
-        else:
-            # Normal move or capture
-            board.move_piece(move.from_pos, move.to_pos)
+        _EXECUTORS[move.move_type](board, move, piece)
+
+
+def _exec_normal(board: Board, move: Move, piece: Piece):
+    """Normal move, capture or pawn double push."""
+    board.move_piece(move.from_pos, move.to_pos)
+
+
+def _exec_castle_kingside(board: Board, move: Move, piece: Piece):
+    """Move the king, then the h-file rook."""
+    board.move_piece(move.from_pos, move.to_pos)
+    row = move.from_pos.row
+    board.move_piece(Position.of(row, 7), Position.of(row, 5))
+
+
+def _exec_castle_queenside(board: Board, move: Move, piece: Piece):
+    """Move the king, then the a-file rook."""
+    board.move_piece(move.from_pos, move.to_pos)
+    row = move.from_pos.row
+    board.move_piece(Position.of(row, 0), Position.of(row, 3))
+
+
+def _exec_en_passant(board: Board, move: Move, piece: Piece):
+    """Move the pawn and remove the pawn it captured."""
+    board.move_piece(move.from_pos, move.to_pos)
+    board.remove_piece(Position.of(move.from_pos.row, move.to_pos.col))
+
+
+def _exec_promotion(board: Board, move: Move, piece: Piece):
+    """Replace the pawn with the promoted piece on the target square."""
+    board.remove_piece(move.from_pos)
+    board.set_piece(move.to_pos, create_piece(piece.color, move.promotion_piece))
+
+
+# Simulation handlers indexed by MoveType value
+_EXECUTORS = [_exec_normal] * (max(MoveType) + 1)
+_EXECUTORS[MoveType.CASTLING_KINGSIDE] = _exec_castle_kingside
+_EXECUTORS[MoveType.CASTLING_QUEENSIDE] = _exec_castle_queenside
+_EXECUTORS[MoveType.EN_PASSANT] = _exec_en_passant
+_EXECUTORS[MoveType.PROMOTION] = _exec_promotion
@@ -2,29 +2,56 @@
 Chess piece classes with their movement logic.
 """
 from abc import ABC, abstractmethod
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 from game.types import Color, PieceType, Position, Move, MoveType
+from game.bitboards import (KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, PAWN_PUSHES,
+                            PAWN_START_RANKS, PROMOTION_RANKS, rook_attacks, bishop_attacks)
 
 if TYPE_CHECKING:
     from game.board import Board
 
 
+# Pawn push, attack and start-rank tables per color id, so move generation
+# never branches on color
+_PAWN_TABLES = tuple((PAWN_PUSHES[color], PAWN_ATTACKS[color], PAWN_START_RANKS[color])
+                     for color in (Color.WHITE, Color.BLACK))
+
+_PROMOTION_TYPES = (PieceType.QUEEN, PieceType.ROOK, PieceType.KNIGHT, PieceType.BISHOP)
+
+
 class Piece(ABC):
     """Abstract base class for all chess pieces."""
     
+    # Pieces carry their color and type plus fixed values derived from
+    # them; no per-instance __dict__
+    __slots__ = ('color', 'piece_type', '_color_id', '_type_id', '_id', '_notation')
+    
     def __init__(self, color: Color, piece_type: PieceType):
         self.color = color
         self.piece_type = piece_type
+        # Integer color/type ids for cheap comparisons and table lookups,
+        # plus a combined key (0-11) and 'w_pawn' style name, fixed per piece
+        self._color_id = int(color)
+        self._type_id = int(piece_type)
+        self._id = self._color_id * 6 + self._type_id
+        self._notation = f"{str(color)[0]}_{str(piece_type)}"
     
     @abstractmethod
-    def get_possible_moves(self, position: Position, board: 'Board') -> List[Move]:
+    def get_possible_moves(self, position: Position, board: 'Board',
+                           moves: Optional[List[Move]] = None) -> List[Move]:
         """
         Get all possible moves for this piece from the given position.
         This does not check for check/checkmate - just raw piece movement.
+        When a moves list is given the moves are appended to it and it is
+        returned, so callers can collect several pieces into one list.
         """
         pass
     
+    def __deepcopy__(self, memo) -> 'Piece':
+        # Pieces are immutable flyweights (see create_piece), so share them
+        return self
+    
     def get_piece_value(self) -> int:
         """Get the material value of this piece."""
         values = {
@@ -39,66 +66,100 @@ class Piece(ABC):
     
     def to_string_notation(self) -> str:
         """Convert to string notation like 'w_pawn' for compatibility."""
-        return f"{self.color.value[0]}_{ self.piece_type.value}"
+        return self._notation
     
     def __str__(self) -> str:
-        return f"{self.color.value.capitalize()} {self.piece_type.value.capitalize()}"
+        return f"{str(self.color).capitalize()} {str(self.piece_type).capitalize()}"
     
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.color}, {self.piece_type})"
 
 
+def _append_target_moves(moves: List[Move], position: Position, board: 'Board',
+                         targets: int, enemy: int):
+    """
+    Append a move to every square set in the targets bitboard.
+    Squares also set in enemy become captures of the piece standing there.
+    """
+    squares = board._squares
+    
+    # Split captures from quiet moves up front so neither loop has to branch
+    captures = targets & enemy
+    while captures:
+        lsb = captures & -captures
+        to_sq = lsb.bit_length() - 1
+        moves.append(Move(position, Position.of(to_sq >> 3, to_sq & 7), MoveType.CAPTURE,
+                          captured_piece=squares[to_sq]))
+        captures ^= lsb
+    
+    quiets = targets & ~enemy
+    while quiets:
+        lsb = quiets & -quiets
+        to_sq = lsb.bit_length() - 1
+        moves.append(Move(position, Position.of(to_sq >> 3, to_sq & 7), MoveType.NORMAL))
+        quiets ^= lsb
+
+
 class Pawn(Piece):
     """Pawn piece with its unique movement rules."""
     
+    __slots__ = ()
+    
     def __init__(self, color: Color):
         super().__init__(color, PieceType.PAWN)
     
-    def get_possible_moves(self, position: Position, board: 'Board') -> List[Move]:
-        moves = []
-        direction = -1 if self.color == Color.WHITE else 1
-        start_row = 6 if self.color == Color.WHITE else 1
+    def get_possible_moves(self, position: Position, board: 'Board',
+                           moves: Optional[List[Move]] = None) -> List[Move]:
+        if moves is None:
+            moves = []
+        squares = board._squares
+        sq = position.row * 8 + position.col
+        enemy = board.occupancy[self.color.opposite()]
+        empty = ~(board.occupancy[self.color] | enemy)
+        pushes, attacks, start_rank = _PAWN_TABLES[self._color_id]
         
         # Single square forward
-        new_row = position.row + direction
-        if 0 <= new_row < 8:
-            forward_pos = Position(new_row, position.col)
-            if board.get_piece(forward_pos) is None:
-                # Check for promotion
-                if new_row == 0 or new_row == 7:
-                    for promo_piece in [PieceType.QUEEN, PieceType.ROOK, PieceType.KNIGHT, PieceType.BISHOP]:
-                        moves.append(Move(position, forward_pos, MoveType.PROMOTION, promo_piece))
-                else:
-                    moves.append(Move(position, forward_pos, MoveType.NORMAL))
-                
-                # Double square forward from starting position
-                if position.row == start_row:
-                    double_row = position.row + 2 * direction
-                    double_pos = Position(double_row, position.col)
-                    if board.get_piece(double_pos) is None:
-                        moves.append(Move(position, double_pos, MoveType.PAWN_DOUBLE))
+        push = pushes[sq] & empty
+        if push:
+            to_sq = push.bit_length() - 1
+            forward_pos = Position.of(to_sq >> 3, to_sq & 7)
+            # Check for promotion
+            if push & PROMOTION_RANKS:
+                for promo_piece in _PROMOTION_TYPES:
+                    moves.append(Move(position, forward_pos, MoveType.PROMOTION, promo_piece))
+            else:
+                moves.append(Move(position, forward_pos, MoveType.NORMAL))
+            
+            # Double square forward from starting position
+            if start_rank >> sq & 1:
+                double = pushes[to_sq] & empty
+                if double:
+                    to_sq = double.bit_length() - 1
+                    moves.append(Move(position, Position.of(to_sq >> 3, to_sq & 7), MoveType.PAWN_DOUBLE))
         
-        # Captures (diagonal)
-        for col_delta in [-1, 1]:
-            new_col = position.col + col_delta
-            new_row = position.row + direction
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                capture_pos = Position(new_row, new_col)
-                target_piece = board.get_piece(capture_pos)
-                
-                # Normal capture
-                if target_piece and target_piece.color != self.color:
-                    if new_row == 0 or new_row == 7:
-                        for promo_piece in [PieceType.QUEEN, PieceType.ROOK, PieceType.KNIGHT, PieceType.BISHOP]:
-                            moves.append(Move(position, capture_pos, MoveType.PROMOTION, promo_piece, target_piece))
-                    else:
-                        moves.append(Move(position, capture_pos, MoveType.CAPTURE, captured_piece=target_piece))
-                
-                # En passant
-                elif target_piece is None and board.en_passant_target == capture_pos:
-                    en_passant_pawn_pos = Position(position.row, new_col)
-                    en_passant_pawn = board.get_piece(en_passant_pawn_pos)
-                    moves.append(Move(position, capture_pos, MoveType.EN_PASSANT, captured_piece=en_passant_pawn))
+        # Captures (diagonal), including an empty en passant target
+        en_passant = board.en_passant_target
+        en_passant_bit = (1 << (en_passant.row * 8 + en_passant.col)) & empty if en_passant else 0
+        targets = attacks[sq] & (enemy | en_passant_bit)
+        while targets:
+            lsb = targets & -targets
+            to_sq = lsb.bit_length() - 1
+            capture_pos = Position.of(to_sq >> 3, to_sq & 7)
+            
+            # Normal capture
+            if lsb & enemy:
+                target_piece = squares[to_sq]
+                if lsb & PROMOTION_RANKS:
+                    for promo_piece in _PROMOTION_TYPES:
+                        moves.append(Move(position, capture_pos, MoveType.PROMOTION, promo_piece, target_piece))
+                else:
+                    moves.append(Move(position, capture_pos, MoveType.CAPTURE, captured_piece=target_piece))
+            
+            # En passant
+            else:
+                en_passant_pawn = squares[position.row * 8 + (to_sq & 7)]
+                moves.append(Move(position, capture_pos, MoveType.EN_PASSANT, captured_piece=en_passant_pawn))
+            targets ^= lsb
         
         return moves
 
@@ -106,32 +167,21 @@ class Pawn(Piece):
 class Rook(Piece):
     """Rook piece - moves horizontally and vertically."""
     
+    __slots__ = ()
+    
     def __init__(self, color: Color):
         super().__init__(color, PieceType.ROOK)
     
-    def get_possible_moves(self, position: Position, board: 'Board') -> List[Move]:
-        moves = []
+    def get_possible_moves(self, position: Position, board: 'Board',
+                           moves: Optional[List[Move]] = None) -> List[Move]:
+        if moves is None:
+            moves = []
         
-        # Horizontal and vertical directions
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        
-        for dr, dc in directions:
-            new_row, new_col = position.row + dr, position.col + dc
-            
-            while 0 <= new_row < 8 and 0 <= new_col < 8:
-                new_pos = Position(new_row, new_col)
-                target_piece = board.get_piece(new_pos)
-                
-                if target_piece is None:
-                    moves.append(Move(position, new_pos, MoveType.NORMAL))
-                elif target_piece.color != self.color:
-                    moves.append(Move(position, new_pos, MoveType.CAPTURE, captured_piece=target_piece))
-                    break
-                else:
-                    break
-                
-                new_row += dr
-                new_col += dc
+        # Horizontal and vertical rays up to the first blocker
+        own = board.occupancy[self.color]
+        enemy = board.occupancy[self.color.opposite()]
+        targets = rook_attacks(position.row * 8 + position.col, own | enemy) & ~own
+        _append_target_moves(moves, position, board, targets, enemy)
         
         return moves
 
@@ -139,30 +189,20 @@ class Rook(Piece):
 class Knight(Piece):
     """Knight piece - moves in L-shape."""
     
+    __slots__ = ()
+    
     def __init__(self, color: Color):
         super().__init__(color, PieceType.KNIGHT)
     
-    def get_possible_moves(self, position: Position, board: 'Board') -> List[Move]:
-        moves = []
+    def get_possible_moves(self, position: Position, board: 'Board',
+                           moves: Optional[List[Move]] = None) -> List[Move]:
+        if moves is None:
+            moves = []
         
-        # All possible L-shaped moves
-        knight_moves = [
-            (-2, -1), (-2, 1), (-1, -2), (-1, 2),
-            (1, -2), (1, 2), (2, -1), (2, 1)
-        ]
-        
-        for dr, dc in knight_moves:
-            new_row = position.row + dr
-            new_col = position.col + dc
-            
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                new_pos = Position(new_row, new_col)
-                target_piece = board.get_piece(new_pos)
-                
-                if target_piece is None:
-                    moves.append(Move(position, new_pos, MoveType.NORMAL))
-                elif target_piece.color != self.color:
-                    moves.append(Move(position, new_pos, MoveType.CAPTURE, captured_piece=target_piece))
+        # Precomputed L-shaped targets, minus squares held by our own pieces
+        own = board.occupancy[self.color]
+        targets = KNIGHT_ATTACKS[position.row * 8 + position.col] & ~own
+        _append_target_moves(moves, position, board, targets, board.occupancy[self.color.opposite()])
         
         return moves
 
@@ -170,32 +210,21 @@ class Knight(Piece):
 class Bishop(Piece):
     """Bishop piece - moves diagonally."""
     
+    __slots__ = ()
+    
     def __init__(self, color: Color):
         super().__init__(color, PieceType.BISHOP)
     
-    def get_possible_moves(self, position: Position, board: 'Board') -> List[Move]:
-        moves = []
+    def get_possible_moves(self, position: Position, board: 'Board',
+                           moves: Optional[List[Move]] = None) -> List[Move]:
+        if moves is None:
+            moves = []
         
-        # Diagonal directions
-        directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
-        
-        for dr, dc in directions:
-            new_row, new_col = position.row + dr, position.col + dc
-            
-            while 0 <= new_row < 8 and 0 <= new_col < 8:
-                new_pos = Position(new_row, new_col)
-                target_piece = board.get_piece(new_pos)
-                
-                if target_piece is None:
-                    moves.append(Move(position, new_pos, MoveType.NORMAL))
-                elif target_piece.color != self.color:
-                    moves.append(Move(position, new_pos, MoveType.CAPTURE, captured_piece=target_piece))
-                    break
-                else:
-                    break
-                
-                new_row += dr
-                new_col += dc
+        # Diagonal rays up to the first blocker
+        own = board.occupancy[self.color]
+        enemy = board.occupancy[self.color.opposite()]
+        targets = bishop_attacks(position.row * 8 + position.col, own | enemy) & ~own
+        _append_target_moves(moves, position, board, targets, enemy)
         
         return moves
 
@@ -203,35 +232,23 @@ class Bishop(Piece):
 class Queen(Piece):
     """Queen piece - combines rook and bishop movement."""
     
+    __slots__ = ()
+    
     def __init__(self, color: Color):
         super().__init__(color, PieceType.QUEEN)
     
-    def get_possible_moves(self, position: Position, board: 'Board') -> List[Move]:
-        moves = []
+    def get_possible_moves(self, position: Position, board: 'Board',
+                           moves: Optional[List[Move]] = None) -> List[Move]:
+        if moves is None:
+            moves = []
         
-        # Combination of rook and bishop directions
-        directions = [
-            (0, 1), (0, -1), (1, 0), (-1, 0),  # Rook-like
-            (1, 1), (1, -1), (-1, 1), (-1, -1)  # Bishop-like
-        ]
-        
-        for dr, dc in directions:
-            new_row, new_col = position.row + dr, position.col + dc
-            
-            while 0 <= new_row < 8 and 0 <= new_col < 8:
-                new_pos = Position(new_row, new_col)
-                target_piece = board.get_piece(new_pos)
-                
-                if target_piece is None:
-                    moves.append(Move(position, new_pos, MoveType.NORMAL))
-                elif target_piece.color != self.color:
-                    moves.append(Move(position, new_pos, MoveType.CAPTURE, captured_piece=target_piece))
-                    break
-                else:
-                    break
-                
-                new_row += dr
-                new_col += dc
+        # Rook and bishop rays fused into one target set
+        sq = position.row * 8 + position.col
+        own = board.occupancy[self.color]
+        enemy = board.occupancy[self.color.opposite()]
+        occ = own | enemy
+        targets = (rook_attacks(sq, occ) | bishop_attacks(sq, occ)) & ~own
+        _append_target_moves(moves, position, board, targets, enemy)
         
         return moves
 
@@ -239,65 +256,56 @@ class Queen(Piece):
 class King(Piece):
     """King piece - moves one square in any direction."""
     
+    __slots__ = ()
+    
     def __init__(self, color: Color):
         super().__init__(color, PieceType.KING)
     
-    def get_possible_moves(self, position: Position, board: 'Board') -> List[Move]:
-        moves = []
+    def get_possible_moves(self, position: Position, board: 'Board',
+                           moves: Optional[List[Move]] = None) -> List[Move]:
+        if moves is None:
+            moves = []
         
-        # One square in all directions
-        directions = [
-            (0, 1), (0, -1), (1, 0), (-1, 0),
-            (1, 1), (1, -1), (-1, 1), (-1, -1)
-        ]
-        
-        for dr, dc in directions:
-            new_row = position.row + dr
-            new_col = position.col + dc
-            
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                new_pos = Position(new_row, new_col)
-                target_piece = board.get_piece(new_pos)
-                
-                if target_piece is None:
-                    moves.append(Move(position, new_pos, MoveType.NORMAL))
-                elif target_piece.color != self.color:
-                    moves.append(Move(position, new_pos, MoveType.CAPTURE, captured_piece=target_piece))
+        # One square in all directions, from the precomputed king table
+        own = board.occupancy[self.color]
+        targets = KING_ATTACKS[position.row * 8 + position.col] & ~own
+        _append_target_moves(moves, position, board, targets, board.occupancy[self.color.opposite()])
         
         # Castling moves (will be validated separately)
+        castling = board.castling_rights.mask(self.color)
         # Kingside
-        if board.castling_rights.can_castle(self.color, True):
+        if castling & 2:
             castling_col = position.col + 2
             if 0 <= castling_col < 8:
-                castling_pos = Position(position.row, castling_col)
+                castling_pos = Position.of(position.row, castling_col)
                 moves.append(Move(position, castling_pos, MoveType.CASTLING_KINGSIDE))
         
         # Queenside
-        if board.castling_rights.can_castle(self.color, False):
+        if castling & 1:
             castling_col = position.col - 2
             if 0 <= castling_col < 8:
-                castling_pos = Position(position.row, castling_col)
+                castling_pos = Position.of(position.row, castling_col)
                 moves.append(Move(position, castling_pos, MoveType.CASTLING_QUEENSIDE))
         
         return moves
 
 
+# One shared instance per (color, type); pieces never change after creation
+_PIECE_POOL = {
+    (color, piece_class(color).piece_type): piece_class(color)
+    for color in Color
+    for piece_class in (Pawn, Rook, Knight, Bishop, Queen, King)
+}
+
+
 def create_piece(color: Color, piece_type: PieceType) -> Piece:
-    """Factory function to create pieces."""
-    piece_classes = {
-        PieceType.PAWN: Pawn,
-        PieceType.ROOK: Rook,
-        PieceType.KNIGHT: Knight,
-        PieceType.BISHOP: Bishop,
-        PieceType.QUEEN: Queen,
-        PieceType.KING: King
-    }
-    return piece_classes[piece_type](color)
+    """Factory function returning the shared piece for a color and type."""
+    return _PIECE_POOL[(color, piece_type)]
 
 
 def piece_from_string(piece_str: str) -> Piece:
     """Create a piece from string notation like 'w_pawn'."""
     color_char, piece_name = piece_str.split('_')
     color = Color.WHITE if color_char == 'w' else Color.BLACK
-    piece_type = PieceType(piece_name)
+    piece_type = PieceType[piece_name.upper()]
     return create_piece(color, piece_type)
@@ -2,11 +2,51 @@
 Rendering logic separated from game logic.
 """
 import pygame
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Set
 
 from game.types import Color, Position, GameStatus, PieceType
 from game.board import Board
 from game.game_state import GameState
+from game.pieces import Piece, create_piece
+
+
+# Per-square overlay flags, combined into the square's redraw key
+_LAST_MOVE = 1
+_SELECTED = 2
+_LEGAL = 4
+_CHECK = 8
+
+# Edge length of the captured-piece thumbnails in the sidebar
+_CAPTURED_PIECE_SIZE = 40
+
+# Indices (row * 8 + col) of the dark board squares
+_DARK_SQUARES = tuple(idx for idx in range(64) if ((idx >> 3) + (idx & 7)) & 1)
+
+# Checkered board backgrounds shared by every Renderer, keyed by
+# (square size, light color, dark color)
+_BOARD_BG_CACHE: Dict[tuple, pygame.Surface] = {}
+
+# Translucent square overlays shared by every Renderer, keyed by
+# (size, color, circle radius)
+_OVERLAY_CACHE: Dict[tuple, pygame.Surface] = {}
+
+
+def _overlay_surface(size: int, color: tuple, circle_radius: int = 0) -> pygame.Surface:
+    """
+    Get a square overlay filled with color, or holding a centered circle of
+    that color when a radius is given. Each distinct overlay is built once.
+    """
+    key = (size, color, circle_radius)
+    surf = _OVERLAY_CACHE.get(key)
+    if surf is None:
+        surf = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+        if circle_radius:
+            surf.fill((0, 0, 0, 0))
+            pygame.draw.circle(surf, color, (size // 2, size // 2), circle_radius)
+        else:
+            surf.fill(color)
+        _OVERLAY_CACHE[key] = surf
+    return surf
 
 
 class Renderer:
@@ -28,6 +68,20 @@ class Renderer:
         self.square_size = square_size
         self.piece_images = piece_images
         
+        # Piece images indexed by Piece._id, and sidebar thumbnails (scaled
+        # once) indexed by [color][piece type], so drawing skips the string keys
+        self._img_by_id: List[Optional[pygame.Surface]] = [None] * 12
+        self._thumbs_by_color: List[List[Optional[pygame.Surface]]] = [[None] * 6 for _ in Color]
+        thumb_size = (_CAPTURED_PIECE_SIZE, _CAPTURED_PIECE_SIZE)
+        for color in Color:
+            for piece_type in PieceType:
+                piece = create_piece(color, piece_type)
+                image = piece_images.get(piece.to_string_notation())
+                self._img_by_id[piece._id] = image
+                if image:
+                    thumb = pygame.transform.scale(image, thumb_size).convert_alpha()
+                    self._thumbs_by_color[color][piece_type] = thumb
+        
         # Colors
         self.light_square_color = (238, 238, 210)
         self.dark_square_color = (118, 150, 86)
@@ -39,23 +93,251 @@ class Renderer:
         # Font for text
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
+        self.title_font = pygame.font.Font(None, 28)
         
-        # Undo/Redo button rectangles
+        # Undo/Redo button rectangles, laid out on first draw (and again
+        # if the sidebar geometry changes)
         self.undo_button_rect = None
         self.redo_button_rect = None
+        self._button_layout: Optional[tuple] = None
+        # Button faces keyed by (label, enabled), rendered with the layout
+        self._button_surfs: Dict[tuple, pygame.Surface] = {}
+        
+        # Screen rect of every square, indexed by row * 8 + col
+        self._square_rects: List[pygame.Rect] = []
+        self._layout_squares()
+        
+        # Static checkered board, rebuilt whenever the square colors change
+        self._board_bg: Optional[pygame.Surface] = None
+        self._rebuild_board_bg()
+        
+        # Sidebar background with its fixed title, built on first draw
+        # (and again if the sidebar size changes)
+        self._sidebar_bg: Optional[pygame.Surface] = None
+        
+        # Darkening overlay for the game over message, built on first use
+        self._game_over_overlay: Optional[pygame.Surface] = None
+        
+        # Translucent square overlays, reused every frame
+        self._rebuild_highlight_surfaces()
+        
+        # Coordinate label text never changes, so rasterize it once
+        label_color = (100, 100, 100)
+        self._file_labels = [self.small_font.render(chr(ord('a') + col), True, label_color).convert_alpha()
+                             for col in range(8)]
+        self._rank_labels = [self.small_font.render(str(8 - row), True, label_color).convert_alpha()
+                             for row in range(8)]
+        self._layout_coordinates()
+        
+        # Rendered text keyed by (text, font, color); only a handful of
+        # strings ever appear, so each is rasterized once
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+        
+        # Dirty-rect bookkeeping: what each square showed when last drawn,
+        # squares something else has drawn over, and the screen areas
+        # touched since the display was last updated
+        self._square_keys: List[Optional[tuple]] = [None] * 64
+        self._last_fingerprint: Optional[tuple] = None
+        # What the sidebar and its buttons showed when last drawn
+        self._sidebar_key: Optional[tuple] = None
+        self._buttons_key: Optional[tuple] = None
+        self._dirty_squares: Set[int] = set()
+        self._full_dirty = True
+        self._dirty: List[pygame.Rect] = []
+    
+    def get_piece_image(self, piece: Piece) -> Optional[pygame.Surface]:
+        """Board-sized image of a piece, looked up by its id."""
+        return self._img_by_id[piece._id]
+    
+    def _render_text(self, text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+        """Render antialiased text, reusing the surface from earlier frames."""
+        key = (text, font, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+    
+    def invalidate(self):
+        """Force the whole board and sidebar to be redrawn on the next frame."""
+        self._full_dirty = True
+        self._sidebar_key = None
     
-    def draw_board(self, game_state: GameState, legal_moves: Optional[list] = None, 
-                   last_move: Optional[tuple] = None, animating_position: Optional[Position] = None):
+    def mark_area_dirty(self, rect: pygame.Rect):
+        """
+        Force the board squares under a screen area to be redrawn on the next
+        frame, e.g. where an animated piece was drawn over them.
+        """
+        sq = self.square_size
+        area = rect.clip(self._board_bg.get_rect())
+        if not area:
+            return
+        for row in range(area.top // sq, (area.bottom - 1) // sq + 1):
+            for col in range(area.left // sq, (area.right - 1) // sq + 1):
+                self._dirty_squares.add(row * 8 + col)
+    
+    def mark_dirty(self, rect: pygame.Rect):
+        """Record a screen area that must be pushed to the display."""
+        self._dirty.append(rect)
+    
+    def pop_dirty_rects(self) -> List[pygame.Rect]:
+        """Return the areas drawn since the last call and reset the list."""
+        dirty = self._dirty
+        self._dirty = []
+        return dirty
+    
+    def _layout_squares(self):
+        """Compute the screen rect of each board square."""
+        sq = self.square_size
+        self._square_rects = [pygame.Rect(col * sq, row * sq, sq, sq)
+                              for row in range(8) for col in range(8)]
+    
+    def _rebuild_board_bg(self):
+        """Pre-render the checkered board pattern into a single surface."""
+        key = (self.square_size, self.light_square_color, self.dark_square_color)
+        board_bg = _BOARD_BG_CACHE.get(key)
+        if board_bg is None:
+            size = self.square_size * 8
+            board_bg = pygame.Surface((size, size))
+            # Paint it light, then fill the dark squares (odd row + col)
+            board_bg.fill(self.light_square_color)
+            dark = self.dark_square_color
+            square_rects = self._square_rects
+            for idx in _DARK_SQUARES:
+                board_bg.fill(dark, square_rects[idx])
+            board_bg = board_bg.convert()
+            _BOARD_BG_CACHE[key] = board_bg
+        self._board_bg = board_bg
+    
+    def _rebuild_sidebar_bg(self, width: int, height: int):
+        """Pre-render the sidebar background, title and first heading."""
+        sidebar_bg = pygame.Surface((width, height))
+        sidebar_bg.fill((50, 50, 50))
+        
+        title = self.title_font.render("Captured Pieces", True, (255, 255, 255))
+        sidebar_bg.blit(title, title.get_rect(centerx=width // 2, y=20))
+        
+        label = self.small_font.render("By White:", True, (200, 200, 200))
+        sidebar_bg.blit(label, (10, 70))
+        self._sidebar_bg = sidebar_bg.convert()
+    
+    def _rebuild_highlight_surfaces(self):
+        """Fetch the translucent overlays used to highlight squares."""
+        size = self.square_size
+        self._sel_surf = _overlay_surface(size, self.highlight_color)
+        # Legal move indicator: a circle in the center of the square
+        self._legal_surf = _overlay_surface(size, self.legal_move_color, size // 6)
+        self._last_move_surf = _overlay_surface(size, self.last_move_color)
+        self._check_surf = _overlay_surface(size, self.check_color)
+    
+    def draw_board(self, game_state: GameState, legal_moves_bb: int = 0,
+                   last_move: Optional[tuple] = None, animating_position: Optional[Position] = None) -> bool:
         """
         Draw the complete chess board with pieces.
         
         Args:
             game_state: Current game state
-            legal_moves: List of legal move positions to highlight (optional)
+            legal_moves_bb: Bitboard of legal move destinations to highlight (optional)
             last_move: Tuple of (from_pos, to_pos) for last move highlighting
             animating_position: Position to exclude from drawing (for animation)
+            
+        Returns:
+            True if any part of the board was repainted
         """
-        self._draw_squares(game_state)
+        # Nothing the board shows has changed since the last frame
+        board = game_state.board
+        fingerprint = (board, board.version, game_state.selected_position, game_state.game_status,
+                       legal_moves_bb, last_move, animating_position)
+        if (fingerprint == self._last_fingerprint and not self._full_dirty
+                and not self._dirty_squares):
+            return False
+        self._last_fingerprint = fingerprint
+        
+        dirty = self._find_dirty_squares(game_state, legal_moves_bb, last_move, animating_position)
+        if not dirty:
+            return False
+        
+        if len(dirty) == 64:
+            self._draw_layers(game_state, legal_moves_bb, last_move, animating_position)
+            self.mark_dirty(self._board_bg.get_rect())
+            return True
+        
+        # Only repaint the squares whose contents changed, each from the
+        # (piece, overlay flags) key recorded for it
+        blits = []
+        for idx in dirty:
+            blits.extend(self._square_blits(idx))
+            self.mark_dirty(self._square_rects[idx])
+        self.screen.blits(blits, doreturn=False)
+        return True
+    
+    def _square_blits(self, idx: int) -> List[tuple]:
+        """
+        Blits that redraw one square on its own, layered like _draw_layers:
+        background, last move, selection, legal move, check, piece, labels.
+        """
+        rect = self._square_rects[idx]
+        piece, flags = self._square_keys[idx]
+        blits = [(self._board_bg, rect, rect)]
+        if flags & _LAST_MOVE:
+            blits.append((self._last_move_surf, rect))
+        if flags & _SELECTED:
+            blits.append((self._sel_surf, rect))
+        if flags & _LEGAL:
+            blits.append((self._legal_surf, rect))
+        if flags & _CHECK:
+            blits.append((self._check_surf, rect))
+        if piece is not None:
+            piece_image = self._img_by_id[piece._id]
+            if piece_image:
+                blits.append((piece_image, rect))
+        blits.extend(self._square_labels[idx])
+        return blits
+    
+    def _find_dirty_squares(self, game_state: GameState, legal_moves_bb: int,
+                            last_move: Optional[tuple],
+                            animating_position: Optional[Position]) -> List[int]:
+        """
+        Work out which squares look different from the last drawn frame.
+        
+        Returns:
+            Indices (row * 8 + col) of the squares that need repainting
+        """
+        flags = [0] * 64
+        if last_move:
+            for pos in last_move:
+                flags[pos.row * 8 + pos.col] |= _LAST_MOVE
+        if game_state.selected_position:
+            pos = game_state.selected_position
+            flags[pos.row * 8 + pos.col] |= _SELECTED
+        targets = legal_moves_bb
+        while targets:
+            lsb = targets & -targets
+            flags[lsb.bit_length() - 1] |= _LEGAL
+            targets ^= lsb
+        if game_state.game_status == GameStatus.CHECK:
+            king_pos = game_state.board.find_king(game_state.current_turn)
+            if king_pos:
+                flags[king_pos.row * 8 + king_pos.col] |= _CHECK
+        
+        excluded = animating_position.row * 8 + animating_position.col if animating_position else -1
+        keys = self._square_keys
+        full = self._full_dirty
+        forced = self._dirty_squares
+        dirty = []
+        for idx, piece in enumerate(game_state.board._squares):
+            key = (None if idx == excluded else piece, flags[idx])
+            if full or keys[idx] != key or idx in forced:
+                keys[idx] = key
+                dirty.append(idx)
+        self._full_dirty = False
+        forced.clear()
+        return dirty
+    
+    def _draw_layers(self, game_state: GameState, legal_moves_bb: int,
+                     last_move: Optional[tuple], animating_position: Optional[Position]):
+        """Draw every board layer, limited by the screen's current clip rect."""
+        self._draw_squares()
         
         # Highlight last move
         if last_move:
@@ -66,8 +348,8 @@ class Renderer:
             self._draw_selected_highlight(game_state.selected_position)
         
         # Highlight legal moves
-        if legal_moves:
-            self._draw_legal_move_indicators(legal_moves)
+        if legal_moves_bb:
+            self._draw_legal_move_indicators(legal_moves_bb)
         
         # Highlight king in check
         if game_state.game_status == GameStatus.CHECK:
@@ -79,18 +361,9 @@ class Renderer:
         # Draw coordinates
         self._draw_coordinates()
     
-    def _draw_squares(self, game_state: GameState):
-        """Draw the checkered board pattern."""
-        for row in range(8):
-            for col in range(8):
-                color = self.light_square_color if (row + col) % 2 == 0 else self.dark_square_color
-                rect = pygame.Rect(
-                    col * self.square_size,
-                    row * self.square_size,
-                    self.square_size,
-                    self.square_size
-                )
-                pygame.draw.rect(self.screen, color, rect)
+    def _draw_squares(self):
+        """Draw the checkered board pattern from the cached background."""
+        self.screen.blit(self._board_bg, (0, 0))
     
     def _draw_pieces(self, board: Board, exclude_position: Optional[Position] = None):
         """
@@ -100,101 +373,100 @@ class Renderer:
             board: The board to draw pieces from
             exclude_position: Optional position to skip (for animated piece)
         """
-        for row in range(8):
-            for col in range(8):
-                position = Position(row, col)
-                
-                # Skip the animated piece position
-                if exclude_position and position == exclude_position:
-                    continue
-                
-                piece = board.get_piece(position)
-                
-                if piece:
-                    piece_key = piece.to_string_notation()
-                    piece_image = self.piece_images.get(piece_key)
-                    
-                    if piece_image:
-                        x = col * self.square_size
-                        y = row * self.square_size
-                        self.screen.blit(piece_image, (x, y))
+        # Skip the animated piece position, compared by square index
+        excluded = exclude_position.row * 8 + exclude_position.col if exclude_position else -1
+        
+        # Collect every piece image and hand them to SDL in one call
+        images = self._img_by_id
+        rects = self._square_rects
+        blits = []
+        for idx, piece in enumerate(board._squares):
+            if piece is None or idx == excluded:
+                continue
+            piece_image = images[piece._id]
+            if piece_image:
+                blits.append((piece_image, rects[idx]))
+        self.screen.blits(blits, doreturn=False)
     
     def _draw_selected_highlight(self, position: Position):
         """Highlight the selected square."""
-        surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
-        surface.fill(self.highlight_color)
-        x = position.col * self.square_size
-        y = position.row * self.square_size
-        self.screen.blit(surface, (x, y))
-    
-    def _draw_legal_move_indicators(self, legal_move_positions: list):
-        """Draw indicators for legal move destinations."""
-        for position in legal_move_positions:
-            surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
-            
-            # Draw a circle in the center for empty squares
-            center_x = self.square_size // 2
-            center_y = self.square_size // 2
-            radius = self.square_size // 6
-            pygame.draw.circle(surface, self.legal_move_color, (center_x, center_y), radius)
-            
-            x = position.col * self.square_size
-            y = position.row * self.square_size
-            self.screen.blit(surface, (x, y))
+        self.screen.blit(self._sel_surf, self._square_rects[position.row * 8 + position.col])
+    
+    def _draw_legal_move_indicators(self, legal_moves_bb: int):
+        """Draw indicators for the destination squares set in the bitboard."""
+        rects = self._square_rects
+        surf = self._legal_surf
+        blits = []
+        while legal_moves_bb:
+            lsb = legal_moves_bb & -legal_moves_bb
+            blits.append((surf, rects[lsb.bit_length() - 1]))
+            legal_moves_bb ^= lsb
+        self.screen.blits(blits, doreturn=False)
     
     def _draw_last_move_highlight(self, last_move: tuple):
         """Highlight the last move made."""
         from_pos, to_pos = last_move
         
-        for position in [from_pos, to_pos]:
-            surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
-            surface.fill(self.last_move_color)
-            x = position.col * self.square_size
-            y = position.row * self.square_size
-            self.screen.blit(surface, (x, y))
+        rects = self._square_rects
+        surf = self._last_move_surf
+        self.screen.blits([(surf, rects[from_pos.row * 8 + from_pos.col]),
+                           (surf, rects[to_pos.row * 8 + to_pos.col])], doreturn=False)
     
     def _draw_check_highlight(self, game_state: GameState):
         """Highlight the king when in check."""
         king_pos = game_state.board.find_king(game_state.current_turn)
         if king_pos:
-            surface = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
-            surface.fill(self.check_color)
-            x = king_pos.col * self.square_size
-            y = king_pos.row * self.square_size
-            self.screen.blit(surface, (x, y))
+            self.screen.blit(self._check_surf, self._square_rects[king_pos.row * 8 + king_pos.col])
     
     def _draw_coordinates(self):
         """Draw file (a-h) and rank (1-8) labels on the board."""
+        self.screen.blits(self._coordinate_blits, doreturn=False)
+    
+    def _layout_coordinates(self):
+        """Work out where each coordinate label goes, as a ready blit sequence."""
+        blits = []
+        
         # File labels (a-h) at bottom
         for col in range(8):
-            label = chr(ord('a') + col)
-            text = self.small_font.render(label, True, (100, 100, 100))
             x = col * self.square_size + self.square_size - 20
             y = 7 * self.square_size + self.square_size - 20
-            self.screen.blit(text, (x, y))
+            blits.append((self._file_labels[col], (x, y)))
         
         # Rank labels (1-8) on left
         for row in range(8):
-            label = str(8 - row)
-            text = self.small_font.render(label, True, (100, 100, 100))
             x = 5
             y = row * self.square_size + 5
-            self.screen.blit(text, (x, y))
+            blits.append((self._rank_labels[row], (x, y)))
+        
+        self._coordinate_blits = blits
+        
+        # The same labels grouped by the square they sit on
+        self._square_labels: List[List[tuple]] = [[] for _ in range(64)]
+        sq = self.square_size
+        for label, (x, y) in blits:
+            self._square_labels[(y // sq) * 8 + x // sq].append((label, (x, y)))
     
     def draw_game_over_message(self, game_state: GameState):
         """Draw game over message on the screen."""
         if not game_state.is_game_over():
             return
         
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.screen.get_width(), self.screen.get_height()), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
+        # Semi-transparent overlay, rebuilt only if the screen size changes
+        overlay = self._game_over_overlay
+        if overlay is None or overlay.get_size() != self.screen.get_size():
+            overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA).convert_alpha()
+            overlay.fill((0, 0, 0, 150))
+            self._game_over_overlay = overlay
         self.screen.blit(overlay, (0, 0))
         
+        # The overlay darkens the board, so repaint it from scratch next frame
+        self.invalidate()
+        self.mark_dirty(self.screen.get_rect())
+        
         # Determine message
         if game_state.game_status == GameStatus.CHECKMATE:
             winner = game_state.get_winner()
-            message = f"Checkmate! {winner.value.capitalize()} wins!"
+            message = f"Checkmate! {str(winner).capitalize()} wins!"
         elif game_state.game_status == GameStatus.STALEMATE:
             message = "Stalemate! It's a draw!"
         elif game_state.game_status == GameStatus.DRAW:
@@ -203,7 +475,7 @@ class Renderer:
             message = "Game Over!"
         
         # Render text
-        text = self.font.render(message, True, (255, 255, 255))
+        text = self._render_text(message, self.font, (255, 255, 255))
         text_rect = text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
         self.screen.blit(text, text_rect)
     
@@ -212,8 +484,8 @@ class Renderer:
         if game_state.is_game_over():
             return
         
-        turn_text = f"{game_state.current_turn.value.capitalize()}'s turn"
-        text = self.small_font.render(turn_text, True, (50, 50, 50))
+        turn_text = f"{str(game_state.current_turn).capitalize()}'s turn"
+        text = self._render_text(turn_text, self.small_font, (50, 50, 50))
         
         # Draw at top of screen
         self.screen.blit(text, (10, 10))
@@ -223,6 +495,21 @@ class Renderer:
         self.light_square_color = light_square
         self.dark_square_color = dark_square
         self.highlight_color = highlight
+        self._rebuild_board_bg()
+        self._rebuild_highlight_surfaces()
+        self.invalidate()
+    
+    def set_square_size(self, square_size: int):
+        """
+        Change the board square size and rebuild everything laid out by it.
+        Piece images are used as given, so they should already match the size.
+        """
+        self.square_size = square_size
+        self._layout_squares()
+        self._rebuild_board_bg()
+        self._rebuild_highlight_surfaces()
+        self._layout_coordinates()
+        self.invalidate()
     
     def draw_captured_pieces_sidebar(self, game_state: GameState, sidebar_x: int, sidebar_width: int):
         """
@@ -233,41 +520,28 @@ class Renderer:
             sidebar_x: X position where sidebar starts
             sidebar_width: Width of the sidebar
         """
-        # Background for sidebar
-        sidebar_bg_color = (50, 50, 50)
+        # Captures and material only change when the board does
+        board = game_state.board
+        key = (board, board.version, sidebar_x, sidebar_width, self.screen.get_height())
+        if key == self._sidebar_key:
+            return
+        self._sidebar_key = key
+        self._buttons_key = None  # the background below covers the buttons
+        
+        # Background for sidebar, with the title and "By White:" heading
         sidebar_rect = pygame.Rect(sidebar_x, 0, sidebar_width, self.screen.get_height())
-        pygame.draw.rect(self.screen, sidebar_bg_color, sidebar_rect)
-        
-        # Draw title
-        title_font = pygame.font.Font(None, 28)
-        title = title_font.render("Captured Pieces", True, (255, 255, 255))
-        title_rect = title.get_rect(centerx=sidebar_x + sidebar_width // 2, y=20)
-        self.screen.blit(title, title_rect)
-        
-        # Piece values for material count
-        piece_values = {
-            PieceType.PAWN: 1,
-            PieceType.KNIGHT: 3,
-            PieceType.BISHOP: 3,
-            PieceType.ROOK: 5,
-            PieceType.QUEEN: 9,
-        }
+        if self._sidebar_bg is None or self._sidebar_bg.get_size() != sidebar_rect.size:
+            self._rebuild_sidebar_bg(sidebar_rect.width, sidebar_rect.height)
+        self.screen.blit(self._sidebar_bg, sidebar_rect)
+        self.mark_dirty(sidebar_rect)
         
         # Draw pieces captured by white (black pieces)
-        y_offset = 70
-        label = self.small_font.render("By White:", True, (200, 200, 200))
-        self.screen.blit(label, (sidebar_x + 10, y_offset))
-        y_offset += 30
-        
-        captured_by_white_sorted = sorted(game_state.captured_by_white, 
-                                         key=lambda p: piece_values.get(p, 0), reverse=True)
-        y_offset = self._draw_captured_pieces_list(captured_by_white_sorted, Color.BLACK, 
+        y_offset = 100
+        y_offset = self._draw_captured_pieces_list(game_state.captured_by_white_sorted, Color.BLACK,
                                                    sidebar_x, y_offset, sidebar_width)
         
-        # Calculate material advantage
-        white_material = sum(piece_values.get(p, 0) for p in game_state.captured_by_white)
-        black_material = sum(piece_values.get(p, 0) for p in game_state.captured_by_black)
-        advantage = white_material - black_material
+        # Material advantage, from the tallies GameState keeps
+        advantage = game_state.white_material - game_state.black_material
         
         if advantage > 0:
             adv_text = f"+{advantage}"
@@ -279,18 +553,16 @@ class Renderer:
             adv_text = "="
             adv_color = (200, 200, 200)
         
-        adv_surface = self.small_font.render(adv_text, True, adv_color)
+        adv_surface = self._render_text(adv_text, self.small_font, adv_color)
         self.screen.blit(adv_surface, (sidebar_x + sidebar_width - 40, y_offset - 25))
         
         # Draw pieces captured by black (white pieces)
         y_offset += 30
-        label = self.small_font.render("By Black:", True, (200, 200, 200))
+        label = self._render_text("By Black:", self.small_font, (200, 200, 200))
         self.screen.blit(label, (sidebar_x + 10, y_offset))
         y_offset += 30
         
-        captured_by_black_sorted = sorted(game_state.captured_by_black,
-                                         key=lambda p: piece_values.get(p, 0), reverse=True)
-        self._draw_captured_pieces_list(captured_by_black_sorted, Color.WHITE,
+        self._draw_captured_pieces_list(game_state.captured_by_black_sorted, Color.WHITE,
                                        sidebar_x, y_offset, sidebar_width)
     
     def _draw_captured_pieces_list(self, captured_pieces: List[PieceType], piece_color: Color,
@@ -309,34 +581,24 @@ class Renderer:
             Final Y position after drawing
         """
         if not captured_pieces:
-            no_pieces_text = self.small_font.render("None", True, (120, 120, 120))
+            no_pieces_text = self._render_text("None", self.small_font, (120, 120, 120))
             self.screen.blit(no_pieces_text, (sidebar_x + 20, y_start))
             return y_start + 30
         
         # Piece size for sidebar (smaller than board pieces)
-        piece_size = 40
+        piece_size = _CAPTURED_PIECE_SIZE
         pieces_per_row = (sidebar_width - 20) // piece_size
         
         x = sidebar_x + 10
         y = y_start
         count = 0
+        thumbs = self._thumbs_by_color[piece_color]
         
         for piece_type in captured_pieces:
             # Get piece image
-            color_prefix = 'w' if piece_color == Color.WHITE else 'b'
-            piece_name_map = {
-                PieceType.PAWN: 'pawn',
-                PieceType.KNIGHT: 'knight',
-                PieceType.BISHOP: 'bishop',
-                PieceType.ROOK: 'rook',
-                PieceType.QUEEN: 'queen',
-            }
-            piece_name = f"{color_prefix}_{piece_name_map.get(piece_type, 'pawn')}"
-            piece_image = self.piece_images.get(piece_name)
+            scaled_image = thumbs[piece_type]
             
-            if piece_image:
-                # Scale down the piece image
-                scaled_image = pygame.transform.scale(piece_image, (piece_size, piece_size))
+            if scaled_image:
                 self.screen.blit(scaled_image, (x, y))
             
             x += piece_size
@@ -359,48 +621,57 @@ class Renderer:
             sidebar_width: Width of the sidebar
             board_height: Height of the board for positioning
         """
+        layout = (sidebar_x, sidebar_width, board_height)
+        if self._button_layout != layout:
+            self._layout_buttons(sidebar_x, sidebar_width, board_height)
+            self._button_layout = layout
+        
+        can_undo = game_state.can_undo()
+        can_redo = game_state.can_redo()
+        key = (layout, can_undo, can_redo)
+        if key == self._buttons_key:
+            return
+        self._buttons_key = key
+        
+        # Each button is blue when available and gray when disabled
+        buttons = self._button_surfs
+        self.screen.blit(buttons[("Undo", can_undo)], self.undo_button_rect)
+        self.screen.blit(buttons[("Redo", can_redo)], self.redo_button_rect)
+        self.mark_dirty(self.undo_button_rect)
+        self.mark_dirty(self.redo_button_rect)
+    
+    def _layout_buttons(self, sidebar_x: int, sidebar_width: int, board_height: int):
+        """Place the undo and redo buttons side by side near the sidebar bottom."""
         button_width = (sidebar_width - 30) // 2
         button_height = 40
-        spacing = 10
         y_pos = board_height - 60
         
-        # Undo button
         undo_x = sidebar_x + 10
-        self.undo_button_rect = pygame.Rect(undo_x, y_pos, button_width, button_height)
-        
-        # Color based on availability
-        if game_state.can_undo():
-            undo_color = (70, 130, 180)  # Blue when active
-            text_color = (255, 255, 255)
-        else:
-            undo_color = (100, 100, 100)  # Gray when disabled
-            text_color = (150, 150, 150)
-        
-        pygame.draw.rect(self.screen, undo_color, self.undo_button_rect, border_radius=5)
-        pygame.draw.rect(self.screen, (0, 0, 0), self.undo_button_rect, width=2, border_radius=5)
-        
-        undo_text = self.small_font.render("Undo", True, text_color)
-        undo_text_rect = undo_text.get_rect(center=self.undo_button_rect.center)
-        self.screen.blit(undo_text, undo_text_rect)
-        
-        # Redo button
         redo_x = sidebar_x + button_width + 20
+        self.undo_button_rect = pygame.Rect(undo_x, y_pos, button_width, button_height)
         self.redo_button_rect = pygame.Rect(redo_x, y_pos, button_width, button_height)
         
-        # Color based on availability
-        if game_state.can_redo():
-            redo_color = (70, 130, 180)  # Blue when active
+        size = (button_width, button_height)
+        self._button_surfs = {(label, enabled): self._render_button(label, enabled, size)
+                              for label in ("Undo", "Redo") for enabled in (True, False)}
+    
+    def _render_button(self, label: str, enabled: bool, size: tuple) -> pygame.Surface:
+        """Pre-render one undo/redo button face."""
+        if enabled:
+            button_color = (70, 130, 180)  # Blue when active
             text_color = (255, 255, 255)
         else:
-            redo_color = (100, 100, 100)  # Gray when disabled
+            button_color = (100, 100, 100)  # Gray when disabled
             text_color = (150, 150, 150)
         
-        pygame.draw.rect(self.screen, redo_color, self.redo_button_rect, border_radius=5)
-        pygame.draw.rect(self.screen, (0, 0, 0), self.redo_button_rect, width=2, border_radius=5)
+        surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        local_rect = surface.get_rect()
+        pygame.draw.rect(surface, button_color, local_rect, border_radius=5)
+        pygame.draw.rect(surface, (0, 0, 0), local_rect, width=2, border_radius=5)
         
-        redo_text = self.small_font.render("Redo", True, text_color)
-        redo_text_rect = redo_text.get_rect(center=self.redo_button_rect.center)
-        self.screen.blit(redo_text, redo_text_rect)
+        text = self.small_font.render(label, True, text_color)
+        surface.blit(text, text.get_rect(center=local_rect.center))
+        return surface
     
     def is_undo_button_clicked(self, pos: tuple) -> bool:
         """Check if undo button was clicked."""
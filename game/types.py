@@ -1,7 +1,7 @@
 """
 Core data types and enums for the chess game.
 """
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass
 
@@ -9,33 +9,56 @@ if TYPE_CHECKING:
     from game.pieces import Piece
 
 
-class Color(Enum):
-    """Represents piece colors."""
-    WHITE = "white"
-    BLACK = "black"
+class Color(IntEnum):
+    """
+    Represents piece colors.
+    Integer valued so comparisons and hashing stay in C; str() gives the
+    lowercase name ('white' / 'black').
+    """
+    WHITE = 0
+    BLACK = 1
     
     def opposite(self) -> 'Color':
         """Returns the opposite color."""
-        return Color.BLACK if self == Color.WHITE else Color.WHITE
+        return _OPP[self]
     
     def __str__(self) -> str:
-        return self.value
+        return _COLOR_NAMES[self]
+    
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+
+_COLOR_NAMES = ('white', 'black')
+_OPP = (Color.BLACK, Color.WHITE)
 
 
-class PieceType(Enum):
-    """Represents chess piece types."""
-    PAWN = "pawn"
-    ROOK = "rook"
-    KNIGHT = "knight"
-    BISHOP = "bishop"
-    QUEEN = "queen"
-    KING = "king"
+class PieceType(IntEnum):
+    """
+    Represents chess piece types.
+    Integer valued like Color; str() gives the lowercase name ('pawn', ...).
+    """
+    PAWN = 0
+    ROOK = 1
+    KNIGHT = 2
+    BISHOP = 3
+    QUEEN = 4
+    KING = 5
     
     def __str__(self) -> str:
-        return self.value
+        return _PIECE_TYPE_NAMES[self]
+    
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
 
+_PIECE_TYPE_NAMES = ('pawn', 'rook', 'knight', 'bishop', 'queen', 'king')
 
-class GameStatus(Enum):
+# SAN piece letters, indexed by PieceType (pawns have none)
+_SAN = ('', 'R', 'N', 'B', 'Q', 'K')
+
+
+class GameStatus(IntEnum):
     """Represents the current status of the game."""
     ACTIVE = auto()
     CHECK = auto()
@@ -44,8 +67,11 @@ class GameStatus(Enum):
     DRAW = auto()
 
 
-class MoveType(Enum):
-    """Represents special move types."""
+class MoveType(IntEnum):
+    """
+    Represents special move types.
+    Integer valued so handlers can be looked up by index.
+    """
     NORMAL = auto()
     CAPTURE = auto()
     CASTLING_KINGSIDE = auto()
@@ -55,22 +81,44 @@ class MoveType(Enum):
     PAWN_DOUBLE = auto()
 
 
-@dataclass(frozen=True)
 class Position:
     """
     Represents a position on the chess board.
     Row and column are 0-indexed (0-7).
+    Positions are immutable and hash to their square index (row * 8 + col).
     """
-    row: int
-    col: int
     
-    def __post_init__(self):
-        if not (0 <= self.row < 8 and 0 <= self.col < 8):
-            raise ValueError(f"Invalid position: ({self.row}, {self.col})")
+    __slots__ = ('row', 'col', '_hash')
+    
+    def __init__(self, row: int, col: int):
+        if not (0 <= row < 8 and 0 <= col < 8):
+            raise ValueError(f"Invalid position: ({row}, {col})")
+        object.__setattr__(self, 'row', row)
+        object.__setattr__(self, 'col', col)
+        object.__setattr__(self, '_hash', row * 8 + col)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Position is immutable; cannot assign to '{name}'")
+    
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not Position:
+            return NotImplemented
+        return self._hash == other._hash
+    
+    def __hash__(self) -> int:
+        return self._hash
+    
+    def __repr__(self) -> str:
+        return f"Position(row={self.row}, col={self.col})"
+    
+    def __reduce__(self):
+        return (Position, (self.row, self.col))
     
     def to_algebraic(self) -> str:
         """Convert to algebraic notation (e.g., 'e4')."""
-        return f"{chr(ord('a') + self.col)}{8 - self.row}"
+        return _ALGEBRAIC[self._hash]
     
     @staticmethod
     def from_algebraic(notation: str) -> 'Position':
@@ -81,11 +129,26 @@ class Position:
         row = 8 - int(notation[1])
         return Position(row, col)
     
+    @staticmethod
+    def of(row: int, col: int) -> 'Position':
+        """
+        Return the shared Position instance for (row, col).
+        Skips allocation and validation, so row and col must be 0-7.
+        """
+        return _POS_TABLE[row * 8 + col]
+    
     def __str__(self) -> str:
         return self.to_algebraic()
 
 
-@dataclass
+# Interned positions for all 64 squares, indexed by row * 8 + col
+_POS_TABLE = tuple(Position(row, col) for row in range(8) for col in range(8))
+
+# Algebraic names for all 64 squares, indexed the same way
+_ALGEBRAIC = tuple(f"{chr(ord('a') + col)}{8 - row}" for row in range(8) for col in range(8))
+
+
+@dataclass(slots=True)
 class Move:
     """
     Represents a chess move with all necessary information.
@@ -103,16 +166,14 @@ class Move:
     
     def to_algebraic(self, piece_type: PieceType, is_capture: bool = False) -> str:
         """Convert move to algebraic notation."""
-        piece_symbol = '' if piece_type == PieceType.PAWN else piece_type.value[0].upper()
-        capture_symbol = 'x' if is_capture else ''
-        
         if self.move_type == MoveType.CASTLING_KINGSIDE:
             return "O-O"
         elif self.move_type == MoveType.CASTLING_QUEENSIDE:
             return "O-O-O"
         
-        promotion = f"={self.promotion_piece.value[0].upper()}" if self.promotion_piece else ""
-        return f"{piece_symbol}{capture_symbol}{self.to_pos.to_algebraic()}{promotion}"
+        capture_symbol = 'x' if is_capture else ''
+        promotion = '=' + _SAN[self.promotion_piece] if self.promotion_piece is not None else ''
+        return f"{_SAN[piece_type]}{capture_symbol}{self.to_pos.to_algebraic()}{promotion}"
     
     def __str__(self) -> str:
         return f"{self.from_pos} -> {self.to_pos}"
@@ -121,6 +182,8 @@ class Move:
 class CastlingRights:
     """Tracks castling rights for both players using bit flags."""
     
+    __slots__ = ('_rights',)
+    
     WHITE_KINGSIDE = 0b0001
     WHITE_QUEENSIDE = 0b0010
     BLACK_KINGSIDE = 0b0100
@@ -132,30 +195,26 @@ class CastlingRights:
     
     def can_castle(self, color: Color, kingside: bool) -> bool:
         """Check if castling is allowed for the given color and side."""
-        if color == Color.WHITE:
-            flag = self.WHITE_KINGSIDE if kingside else self.WHITE_QUEENSIDE
-        else:
-            flag = self.BLACK_KINGSIDE if kingside else self.BLACK_QUEENSIDE
-        return bool(self._rights & flag)
+        return bool(self._rights & _CASTLING_FLAGS[color][not kingside])
+    
+    def mask(self, color: Color) -> int:
+        """Both rights of a color as a 2-bit mask: kingside = 2, queenside = 1."""
+        rights = self._rights if color == Color.WHITE else self._rights >> 2
+        return ((rights & 1) << 1) | ((rights >> 1) & 1)
     
     def remove_rights(self, color: Color, kingside: Optional[bool] = None):
         """Remove castling rights. If kingside is None, remove both."""
         if kingside is None:
             # Remove both sides for this color
-            if color == Color.WHITE:
-                self._rights &= ~(self.WHITE_KINGSIDE | self.WHITE_QUEENSIDE)
-            else:
-                self._rights &= ~(self.BLACK_KINGSIDE | self.BLACK_QUEENSIDE)
+            self._rights &= ~_COLOR_CASTLING_FLAGS[color]
         else:
-            if color == Color.WHITE:
-                flag = self.WHITE_KINGSIDE if kingside else self.WHITE_QUEENSIDE
-            else:
-                flag = self.BLACK_KINGSIDE if kingside else self.BLACK_QUEENSIDE
-            self._rights &= ~flag
+            self._rights &= ~_CASTLING_FLAGS[color][not kingside]
     
     def copy(self) -> 'CastlingRights':
         """Create a copy of the castling rights."""
-        return CastlingRights(self._rights)
+        rights = CastlingRights.__new__(CastlingRights)
+        rights._rights = self._rights
+        return rights
     
     def __str__(self) -> str:
         """FEN-style castling rights string."""
@@ -169,3 +228,13 @@ class CastlingRights:
         if self._rights & self.BLACK_QUEENSIDE:
             result += "q"
         return result or "-"
+
+
+# Castling flags indexed by [color][0 for kingside, 1 for queenside]
+_CASTLING_FLAGS = (
+    (CastlingRights.WHITE_KINGSIDE, CastlingRights.WHITE_QUEENSIDE),
+    (CastlingRights.BLACK_KINGSIDE, CastlingRights.BLACK_QUEENSIDE),
+)
+
+# Both castling flags of each color
+_COLOR_CASTLING_FLAGS = tuple(kingside | queenside for kingside, queenside in _CASTLING_FLAGS)
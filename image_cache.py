@@ -0,0 +1,75 @@
+"""
+Shared cache of loaded images.
+Each image is loaded, scaled and converted to the display format once,
+then reused by every game started in the same session.
+"""
+import os
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+import pygame
+
+from constants import ASSETS_PATH
+
+
+# Loaded surfaces keyed by (image name, edge length)
+_cache: Dict[Tuple[str, int], pygame.Surface] = {}
+
+# Font for the "?" on placeholder images, created on the first failed load
+_placeholder_font: Optional[pygame.font.Font] = None
+
+
+def load(name: str, size: int) -> pygame.Surface:
+    """
+    Get the asset image `name`.png scaled to size x size.
+    A red placeholder is returned (and cached) if the file cannot be loaded.
+    Requires the display mode to be set, since surfaces are converted.
+    """
+    key = (name, size)
+    surface = _cache.get(key)
+    if surface is None:
+        surface = _load_scaled(name, size).convert_alpha()
+        _cache[key] = surface
+    return surface
+
+
+class LazyImages(Mapping):
+    """
+    Read-only mapping of image names to surfaces of one size.
+    Nothing is loaded until a name is first looked up.
+    """
+    
+    def __init__(self, names: Sequence[str], size: int):
+        self._names = tuple(names)
+        self._size = size
+    
+    def __getitem__(self, name: str) -> pygame.Surface:
+        if name not in self._names:
+            raise KeyError(name)
+        return load(name, self._size)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+    
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+def _load_scaled(name: str, size: int) -> pygame.Surface:
+    """Load and scale an asset image, falling back to a placeholder."""
+    image_path = os.path.join(ASSETS_PATH, f"{name}.png")
+    try:
+        image = pygame.image.load(image_path)
+        return pygame.transform.scale(image, (size, size))
+    except (pygame.error, OSError) as e:
+        print(f"Error loading image {name}.png: {e}")
+        print(f"Please ensure '{image_path}' exists and is a valid image file.")
+        placeholder = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.rect(placeholder, (255, 0, 0, 128), placeholder.get_rect())
+        global _placeholder_font
+        if _placeholder_font is None:
+            _placeholder_font = pygame.font.Font(None, 24)
+        text = _placeholder_font.render("?", True, (0, 0, 0))
+        text_rect = text.get_rect(center=placeholder.get_rect().center)
+        placeholder.blit(text, text_rect)
+        return placeholder
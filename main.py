@@ -2,9 +2,9 @@
 ChessChampion - A chess game with AI opponent.
 Now using refactored architecture with proper separation of concerns.
 """
-import os
 import pygame
 
+import image_cache
 from ai.ai_player import AIPlayer
 from game.champion_chess import ChessGame
 from game.menu import Menu, GameOverMenu
@@ -15,41 +15,34 @@ from constants import *
 
 pygame.init()
 
-SCREEN = pygame.display.set_mode((WIDTH, HEIGHT))
+SCREEN = pygame.display.set_mode((WIDTH, HEIGHT), pygame.DOUBLEBUF)
 pygame.display.set_caption("Chess Champion")
 
-def load_pieces():
-    """Load and scale piece images."""
-    pieces = {}
-    piece_names = [
-        'b_pawn', 'b_rook', 'b_knight', 'b_bishop', 'b_queen', 'b_king',
-        'w_pawn', 'w_rook', 'w_knight', 'w_bishop', 'w_queen', 'w_king'
-    ]
-    
-    def load_and_scale_image(image_name):
-        try:
-            image_path = os.path.join(ASSETS_PATH, f"{image_name}.png")
-            image = pygame.image.load(image_path).convert_alpha()
-            image = pygame.transform.scale(image, (SQUARE_SIZE, SQUARE_SIZE))
-            return image
-        except pygame.error as e:
-            print(f"Error loading image {image_name}.png: {e}")
-            print(f"Please ensure '{image_path}' exists and is a valid image file.")
-            placeholder = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-            pygame.draw.rect(placeholder, (255, 0, 0, 128), placeholder.get_rect())
-            font = pygame.font.Font(None, 24)
-            text = font.render("?", True, (0, 0, 0))
-            text_rect = text.get_rect(center=placeholder.get_rect().center)
-            placeholder.blit(text, text_rect)
-            return placeholder
-    
-    for name in piece_names:
-        pieces[name] = load_and_scale_image(name)
-    
-    return pieces
+# Piece images, each loaded the first time a game draws it
+PIECES = image_cache.LazyImages([
+    'b_pawn', 'b_rook', 'b_knight', 'b_bishop', 'b_queen', 'b_king',
+    'w_pawn', 'w_rook', 'w_knight', 'w_bishop', 'w_queen', 'w_king'
+], SQUARE_SIZE)
+
+# Window events after which the whole screen has to be pushed again
+REPAINT_EVENTS = [pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+                  pygame.WINDOWSIZECHANGED]
+
+# The only event types the game loop handles; SDL drops the rest
+GAME_EVENTS = [pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN] + REPAINT_EVENTS
+
+
+def trigger_move_animation(game: ChessGame, animation_manager: AnimationManager):
+    """Animate the piece of the game's last move sliding to its destination."""
+    if not game.last_move:
+        return
+    from_pos, to_pos = game.last_move
+    piece = game.board.get_piece(to_pos)
+    if piece:
+        piece_image = game.renderer.get_piece_image(piece)
+        if piece_image:
+            animation_manager.start_animation(from_pos, to_pos, piece_image, SQUARE_SIZE, duration_ms=400)
 
-# Load piece images once
-PIECES = load_pieces()
 
 # Main game loop
 game_active = True
@@ -83,38 +76,70 @@ while game_active:
     
     # If AI plays white, it should move first (only for PvAI)
     ai_should_move_first = (game_mode == 'pvai' and AI_PLAYER_COLOR == 'white')
+    
+    # Background AI search in progress, if any
+    ai_future = None
 
     # Game loop
     running = True
     clock = pygame.time.Clock()
-    game_over_menu_shown = False
+    # Built once when the game over menu first appears
+    game_over_menu = None
+    # Tick count at which the game over menu appears
+    game_over_menu_at = None
+    # Mouse position the game over menu was last drawn for
+    game_over_mouse_pos = None
+    # Whether anything on screen may have changed since the last drawn frame
+    needs_redraw = True
+    # Screen area the animated piece was drawn over on the previous frame
+    animation_rect = None
+    # Whether the window lost its contents and needs a full display update
+    full_update = False
+    # Whether a piece is moving or a move is on its way, as of the last frame
+    busy = True
 
+    # set_allowed() alone leaves every other type enabled, so block all first
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(GAME_EVENTS)
     while running:
-        for event in pygame.event.get():
+        # With no animation, delay or AI move coming up, sleep in SDL until
+        # input arrives instead of polling, then drain whatever else queued
+        events = []
+        if not busy:
+            event = pygame.event.wait(IDLE_EVENT_TIMEOUT_MS)
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+        # One pump, then the whole batch of queued events in one call; only
+        # game events get into the queue, so nothing is left behind in it
+        pygame.event.pump()
+        events.extend(pygame.event.get(pump=False))
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
                 game_active = False
+            elif event.type in REPAINT_EVENTS:
+                # Exposed, restored or resized: nothing on screen can be trusted
+                game.renderer.invalidate()
+                full_update = True
+                needs_redraw = True
             elif event.type == pygame.KEYDOWN:
                 # Handle keyboard shortcuts
                 if event.key == pygame.K_z and pygame.key.get_mods() & pygame.KMOD_CTRL:
                     # Ctrl+Z: Undo
-                    if not animation_manager.is_busy() and not game.game_over:
+                    if not animation_manager.is_busy() and not game.game_over and ai_future is None:
                         if game.game_state.undo_move():
                             print("Move undone")
+                            needs_redraw = True
                 elif event.key == pygame.K_y and pygame.key.get_mods() & pygame.KMOD_CTRL:
                     # Ctrl+Y: Redo
-                    if not animation_manager.is_busy() and not game.game_over:
+                    if not animation_manager.is_busy() and not game.game_over and ai_future is None:
                         if game.game_state.redo_move():
                             print("Move redone")
+                            needs_redraw = True
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                if game.game_over and game_over_menu_shown:
+                if game.game_over and game_over_menu:
                     # Handle game over menu clicks
-                    winner = None
-                    if game.game_state.game_status == GameStatus.CHECKMATE:
-                        # Determine winner
-                        winner = 'white' if game.game_state.current_turn.value == 'black' else 'black'
-                    
-                    game_over_menu = GameOverMenu(SCREEN, WIDTH, HEIGHT, winner)
                     choice = game_over_menu.handle_click(event.pos)
                     
                     if choice == 'new_game':
@@ -122,7 +147,9 @@ while game_active:
                     elif choice == 'end_game':
                         running = False
                         game_active = False
-                elif not game.game_over and not animation_manager.is_busy():
+                elif not game.game_over and not animation_manager.is_busy() and ai_future is None:
+                    # Any click here can change the selection, buttons or board
+                    needs_redraw = True
                     mouse_pos = event.pos
                     
                     # Check if undo/redo buttons were clicked
@@ -150,14 +177,7 @@ while game_active:
                     # Check if a move was made (turn changed)
                     if old_turn != game.turn:
                         # Player made a move, trigger animation
-                        if game.last_move:
-                            from_pos, to_pos = game.last_move
-                            piece = game.board.get_piece(to_pos)
-                            if piece:
-                                piece_key = piece.to_string_notation()
-                                piece_image = PIECES.get(piece_key)
-                                if piece_image:
-                                    animation_manager.start_animation(from_pos, to_pos, piece_image, SQUARE_SIZE, duration_ms=400)
+                        trigger_move_animation(game, animation_manager)
                         
                         # Mark that AI should move after animation completes (only in PvAI mode)
                         if game_mode == 'pvai':
@@ -170,81 +190,102 @@ while game_active:
             ai_move_pending = False
             player_move_pending = True
         
-        # Handle AI first move (when AI plays white) - only in PvAI mode
-        if game_mode == 'pvai' and ai_should_move_first and not animation_manager.is_busy() and not game.game_over and game.turn == AI_PLAYER_COLOR:
-            # Store old board state before AI move
-            old_turn = game.turn
+        # Play the AI's move once its search has finished
+        if ai_future is not None and ai_future.done():
+            best_move = ai_future.result()
+            ai_future = None
             
-            ai_player.make_move()
-            
-            # Trigger AI move animation
-            if game.last_move and old_turn != game.turn:
-                from_pos, to_pos = game.last_move
-                piece = game.board.get_piece(to_pos)
-                if piece:
-                    piece_key = piece.to_string_notation()
-                    piece_image = PIECES.get(piece_key)
-                    if piece_image:
-                        animation_manager.start_animation(from_pos, to_pos, piece_image, SQUARE_SIZE, duration_ms=400)
-            
-            ai_should_move_first = False  # Only do this once
-        
-        # AI makes a move after delay (subsequent moves) - only in PvAI mode
-        if game_mode == 'pvai' and player_move_pending and not animation_manager.is_busy() and not game.game_over and game.turn == AI_PLAYER_COLOR:
             # Store old board state before AI move
             old_turn = game.turn
             
-            ai_player.make_move()
+            ai_player.apply_move(best_move)
             
             # Trigger AI move animation
-            if game.last_move and old_turn != game.turn:
-                from_pos, to_pos = game.last_move
-                piece = game.board.get_piece(to_pos)
-                if piece:
-                    piece_key = piece.to_string_notation()
-                    piece_image = PIECES.get(piece_key)
-                    if piece_image:
-                        animation_manager.start_animation(from_pos, to_pos, piece_image, SQUARE_SIZE, duration_ms=400)
+            if old_turn != game.turn:
+                trigger_move_animation(game, animation_manager)
             
+            ai_should_move_first = False  # Only do this once
             player_move_pending = False
-
-        # Draw everything
-        # If animating, exclude the "from" position so we don't draw duplicate piece
-        animating_from_pos = None
-        if animation_manager.is_animating():
-            animating_from_pos = animation_manager.current_animation.to_pos  # Exclude destination (piece is there after move)
+            needs_redraw = True
         
-        game.draw(SCREEN, SQUARE_SIZE, LIGHT_COLOR_SQUARE, DARK_COLOR_SQUARE, HIGHLIGHT_COLOR, PIECES, animating_from_pos)
+        # Show game over menu if game ended, a moment after the final position
+        # appears; the loop keeps running (and handling QUIT) meanwhile
+        if game.game_over and not game_over_menu:
+            if game_over_menu_at is None:
+                game_over_menu_at = pygame.time.get_ticks() + 1000
+            elif pygame.time.get_ticks() >= game_over_menu_at:
+                # Determine winner for menu
+                winner = None
+                if game.game_state.game_status == GameStatus.CHECKMATE:
+                    winner = 'white' if game.turn == 'black' else 'black'
+                
+                game_over_menu = GameOverMenu(SCREEN, WIDTH, HEIGHT, winner)
+                needs_redraw = True
         
-        # Draw captured pieces sidebar
-        if game.renderer:
-            game.renderer.draw_captured_pieces_sidebar(game.game_state, BOARD_SIZE, SIDEBAR_WIDTH)
-            # Draw undo/redo buttons
-            game.renderer.draw_undo_redo_buttons(game.game_state, BOARD_SIZE, SIDEBAR_WIDTH, HEIGHT)
+        # The menu buttons highlight under the mouse, which sends no events here
+        if game_over_menu:
+            mouse_pos = pygame.mouse.get_pos()
+            if mouse_pos != game_over_mouse_pos:
+                game_over_mouse_pos = mouse_pos
+                needs_redraw = True
         
-        # Draw the animated piece on top
-        if animation_manager.is_animating():
-            animation_manager.draw_animation(SCREEN)
+        # Frames keep coming while a piece is moving, plus one to clear its last position
+        if animation_manager.is_animating() or animation_rect:
+            needs_redraw = True
         
-        # Show game over menu if game ended
-        if game.game_over:
-            if not game_over_menu_shown:
-                # Wait a moment before showing menu
-                pygame.time.wait(1000)
-                game_over_menu_shown = True
+        if needs_redraw:
+            # Draw everything
+            # If animating, exclude the "from" position so we don't draw duplicate piece
+            animating_from_pos = None
+            if animation_manager.is_animating():
+                animating_from_pos = animation_manager.current_animation.to_pos  # Exclude destination (piece is there after move)
+            
+            # Repaint the squares the animated piece covered last frame
+            if animation_rect:
+                game.renderer.mark_area_dirty(animation_rect)
+                animation_rect = None
+            
+            game.draw(SCREEN, SQUARE_SIZE, LIGHT_COLOR_SQUARE, DARK_COLOR_SQUARE, HIGHLIGHT_COLOR, PIECES, animating_from_pos)
             
-            # Determine winner for menu
-            winner = None
-            if game.game_state.game_status == GameStatus.CHECKMATE:
-                winner = 'white' if game.game_state.current_turn.value == 'black' else 'black'
+            # Draw captured pieces sidebar
+            if game.renderer:
+                game.renderer.draw_captured_pieces_sidebar(game.game_state, BOARD_SIZE, SIDEBAR_WIDTH)
+                # Draw undo/redo buttons
+                game.renderer.draw_undo_redo_buttons(game.game_state, BOARD_SIZE, SIDEBAR_WIDTH, HEIGHT)
             
-            game_over_menu = GameOverMenu(SCREEN, WIDTH, HEIGHT, winner)
-            game_over_menu.draw(SCREEN)
+            # Draw the animated piece on top
+            if animation_manager.is_animating():
+                animation_rect = animation_manager.draw_animation(SCREEN)
+                game.renderer.mark_dirty(animation_rect)
+            
+            if game_over_menu:
+                game_over_menu.draw(SCREEN)
+            
+            # Push only what changed; the game-over overlay marks the whole screen
+            dirty_rects = game.renderer.pop_dirty_rects()
+            if full_update:
+                pygame.display.update()
+                full_update = False
+            else:
+                pygame.display.update(dirty_rects)
+            needs_redraw = False
         
-        pygame.display.flip()
+        # AI searches start once this frame is on screen, so the player's
+        # last click shows up first; the search itself runs on a background
+        # thread while the loop keeps drawing and handling events
+        ai_due = ai_should_move_first or player_move_pending
+        if (game_mode == 'pvai' and ai_due and ai_future is None and not animation_manager.is_busy()
+                and not game.game_over and game.turn == AI_PLAYER_COLOR):
+            ai_future = ai_player.start_search()
         
-        # Control frame rate
-        clock.tick(60)
+        # Full frame rate only while a piece moves or a move is on its way;
+        # otherwise the loop mostly sleeps in the event wait above
+        busy = (animation_manager.is_busy() or ai_move_pending or player_move_pending
+                or ai_should_move_first or ai_future is not None
+                or animation_rect is not None)
+        clock.tick(ACTIVE_FPS if busy else IDLE_FPS)
+    
+    pygame.event.set_allowed(None)
 
 # Clean exit
 pygame.quit()